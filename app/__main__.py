@@ -1,58 +1,80 @@
 """
 Entry point for running the app as a module: python -m app
 This starts both the main FastAPI server and the A2A server concurrently.
+
+By default both servers run in this process on a single event loop. Setting
+FASTAPI_WORKERS above 1 runs each server as its own uvicorn process instead,
+with FASTAPI_WORKERS workers for the FastAPI server.
 """
 
 import asyncio
+import json
 import logging
-import subprocess
+import logging.config
+import os
+import sys
+import tempfile
+from typing import List
+from urllib.parse import urlparse
+import ngrok
 import uvicorn
-from .config import DEFAULT_HOST, DEFAULT_PORT, USE_NGROK_FOR_A2A, NGROK_AUTHTOKEN, NGROK_URL, A2A_PORT, ACTIVATE_A2A_SERVER, A2A_HOST, A2A_SERVER_DEFAULT_USER
-from .a2a_server import create_a2a_server
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,  # Changed from DEBUG to INFO
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+from .config import DEFAULT_HOST, DEFAULT_PORT, FASTAPI_WORKERS, MCP_PREFETCH_PACKAGES, USE_NGROK_FOR_A2A, NGROK_AUTHTOKEN, NGROK_URL, A2A_PORT, A2A_WORKERS, ACTIVATE_A2A_SERVER, A2A_HOST, A2A_SERVER_DEFAULT_USER
+from .mcp_prefetch import prefetch_packages as prefetch_mcp_packages
+
+# Logging configuration, shared with the uvicorn servers
+LOGGING_CONFIG = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "default": {
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        },
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+            "formatter": "default",
+        },
+    },
+    "loggers": {
+        "websockets": {"level": "WARNING"},  # Suppress websocket debug logs
+        "asyncio": {"level": "WARNING"},  # Suppress asyncio debug logs
+        "app": {"level": "INFO"},  # Keep application logs at INFO
+        "uvicorn": {"level": "WARNING"},  # Reduce uvicorn verbosity
+        "uvicorn.access": {"level": "WARNING"},  # Suppress access logs
+        "httpx": {"level": "WARNING"},  # Suppress HTTP client debug logs
+        "httpcore": {"level": "WARNING"},  # Suppress HTTP core debug logs
+        "mcp": {"level": "WARNING"},  # Suppress MCP client and stdio logs
+        "anyio": {"level": "WARNING"},  # Suppress anyio errors during MCP cleanup
+        "a2a": {"level": "DEBUG"},  # Enable debug logging for A2A components only
+    },
+    "root": {
+        "level": "INFO",
+        "handlers": ["console"],
+    },
+}
+
+logging.config.dictConfig(LOGGING_CONFIG)
 logger = logging.getLogger(__name__)
 
-# Reduce verbosity of specific loggers
-logging.getLogger('websockets').setLevel(logging.WARNING)  # Suppress websocket debug logs
-logging.getLogger('websockets.client').setLevel(logging.WARNING)  # Suppress websocket client debug logs
-logging.getLogger('websockets.server').setLevel(logging.WARNING)  # Suppress websocket server debug logs
-logging.getLogger('asyncio').setLevel(logging.WARNING)  # Suppress asyncio debug logs
-logging.getLogger('uvicorn').setLevel(logging.INFO)  # Reduce uvicorn verbosity
-logging.getLogger('uvicorn.access').setLevel(logging.WARNING)  # Suppress access logs
-logging.getLogger('httpx').setLevel(logging.WARNING)  # Suppress HTTP client debug logs
-logging.getLogger('httpcore').setLevel(logging.WARNING)  # Suppress HTTP core debug logs
-logging.getLogger('mcp').setLevel(logging.WARNING)  # Suppress MCP client debug logs
-logging.getLogger('mcp.client').setLevel(logging.WARNING)  # Suppress MCP client logs
-logging.getLogger('mcp.client.stdio').setLevel(logging.WARNING)  # Suppress MCP stdio errors
-logging.getLogger('anyio').setLevel(logging.WARNING)  # Suppress anyio errors during MCP cleanup
-
-# Enable debug logging for A2A components only
-logging.getLogger('a2a').setLevel(logging.DEBUG)
-logging.getLogger('a2a.server').setLevel(logging.DEBUG)
-logging.getLogger('a2a.server.request_handlers').setLevel(logging.DEBUG)
-logging.getLogger('a2a.server.tasks').setLevel(logging.DEBUG)
-
-# Enable asyncio debugging (commented out to reduce verbosity)
-# import sys
-# if sys.version_info >= (3, 7):
-#     import asyncio
-#     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy() if sys.platform == 'win32' else asyncio.DefaultEventLoopPolicy())
-
-# Set asyncio debug mode (commented out to reduce verbosity)
-# os.environ['PYTHONASYNCIODEBUG'] = '1'
-
-# Global variable to track ngrok process
-ngrok_process = None
+# Event loop and HTTP parser used by both uvicorn servers
+UVICORN_LOOP = "uvloop" if uvloop is not None else "asyncio"
+UVICORN_HTTP = "httptools"
+UVICORN_WS = "websockets"
+
+# Global variable to track the ngrok tunnel listener
+ngrok_listener = None
 
 
 async def setup_ngrok():
     """Set up ngrok for A2A server if enabled."""
-    global ngrok_process
+    global ngrok_listener
     
     if not USE_NGROK_FOR_A2A:
         logger.info("⚠️ Ngrok for A2A server is disabled")
@@ -69,62 +91,35 @@ async def setup_ngrok():
         return False
     
     try:
-        # Add ngrok authtoken
-        logger.info("🔐 Configuring ngrok authtoken...")
-        subprocess.run([
-            "ngrok", "config", "add-authtoken", NGROK_AUTHTOKEN
-        ], check=True, capture_output=True, text=True)
-        logger.info("✅ Ngrok authtoken configured successfully")
-        
-        # Start ngrok tunnel
+        # Start ngrok tunnel - forward() returns once the tunnel is connected
         logger.info(f"🌐 Starting ngrok tunnel: {NGROK_URL} -> localhost:{A2A_PORT}")
-        ngrok_process = subprocess.Popen([
-            "ngrok", "http", f"--url={NGROK_URL}", str(A2A_PORT)
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        
-        # Give ngrok a moment to start
-        await asyncio.sleep(3)
-        
-        # Check if ngrok process is still running
-        if ngrok_process.poll() is None:
-            logger.info(f"✅ Ngrok tunnel started successfully: {NGROK_URL}")
-            return True
-        else:
-            # Get error output
-            _, stderr = ngrok_process.communicate()
-            logger.error(f"❌ Ngrok failed to start: {stderr}")
-            ngrok_process = None
-            return False
+        ngrok_listener = await ngrok.forward(
+            f"localhost:{A2A_PORT}",
+            authtoken=NGROK_AUTHTOKEN,
+            domain=urlparse(NGROK_URL).netloc or NGROK_URL,
+        )
+        logger.info(f"✅ Ngrok tunnel started successfully: {ngrok_listener.url()}")
+        return True
             
-    except subprocess.CalledProcessError as e:
-        logger.error(f"❌ Failed to configure ngrok: {e}")
-        return False
-    except FileNotFoundError:
-        logger.error("❌ Ngrok not found. Please install ngrok first:")
-        logger.error("   brew install ngrok  # macOS")
-        logger.error("   or download from https://ngrok.com/download")
-        return False
     except Exception as e:
-        logger.error(f"❌ Unexpected error setting up ngrok: {e}")
+        logger.error(f"❌ Ngrok failed to start: {e}")
+        ngrok_listener = None
         return False
 
 
 async def cleanup_ngrok():
-    """Clean up ngrok process."""
-    global ngrok_process
+    """Close the ngrok tunnel."""
+    global ngrok_listener
     
-    if ngrok_process:
+    if ngrok_listener:
         logger.info("🛑 Stopping ngrok tunnel...")
         try:
-            ngrok_process.terminate()
-            await asyncio.sleep(2)
-            if ngrok_process.poll() is None:
-                ngrok_process.kill()
+            await ngrok_listener.close()
             logger.info("✅ Ngrok tunnel stopped")
         except Exception as e:
             logger.error(f"⚠️ Error stopping ngrok: {e}")
         finally:
-            ngrok_process = None
+            ngrok_listener = None
 
 
 async def run_fastapi_server():
@@ -135,7 +130,12 @@ async def run_fastapi_server():
         host=DEFAULT_HOST, 
         port=DEFAULT_PORT, 
         reload=False,  # Disable reload for concurrent execution
-        log_level="info"
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        ws=UVICORN_WS,
+        access_log=False,  # Skip per-request access log records
+        log_config=LOGGING_CONFIG,
+        log_level="warning"
     )
     server = uvicorn.Server(config)
     await server.serve()
@@ -149,6 +149,9 @@ async def run_a2a_server():
             logger.info("⚠️ A2A server is disabled - skipping startup")
             return
         
+        # Only pull in the A2A SDK when the A2A server actually runs in this process
+        from .a2a_server import create_a2a_server
+        
         # Use config values directly (already loaded from environment via config.py)
         host = A2A_HOST
         port = A2A_PORT
@@ -170,7 +173,12 @@ async def run_a2a_server():
             host=host,
             port=port,
             reload=False,
-            log_level="info"  # Changed from debug to info
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
+            ws=UVICORN_WS,
+            access_log=False,  # Skip per-request access log records
+            log_config=LOGGING_CONFIG,
+            log_level="warning"  # App loggers stay at INFO
         )
         server = uvicorn.Server(config)
         await server.serve()
@@ -180,6 +188,86 @@ async def run_a2a_server():
         raise
 
 
+def build_uvicorn_command(
+    app_path: str, host: str, port: int, workers: int, log_config_path: str, factory: bool = False
+) -> List[str]:
+    """Build the command line for a uvicorn server process."""
+    command = [
+        sys.executable, "-m", "uvicorn", app_path,
+        "--host", host,
+        "--port", str(port),
+        "--workers", str(workers),
+        "--loop", UVICORN_LOOP,
+        "--http", UVICORN_HTTP,
+        "--ws", UVICORN_WS,
+        "--no-access-log",
+        "--log-config", log_config_path,
+        "--log-level", "warning",
+    ]
+    if factory:
+        command.append("--factory")
+    return command
+
+
+async def run_servers_in_process(a2a_enabled: bool):
+    """Run both servers in this process on a single event loop."""
+    # Run servers concurrently - if either one fails, the TaskGroup
+    # cancels the other instead of leaving it running on its own
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(run_fastapi_server(), name="fastapi")
+        
+        # Only add A2A server if enabled
+        if a2a_enabled:
+            tg.create_task(run_a2a_server(), name="a2a")
+
+
+async def run_worker_servers(a2a_enabled: bool):
+    """Run each server as a separate uvicorn process with its own worker pool."""
+    logger.warning(
+        "⚠️ Running %d FastAPI workers - sessions, artifacts and per-user caches are not shared between them",
+        FASTAPI_WORKERS,
+    )
+    
+    # uvicorn's command line only takes the logging configuration as a file
+    config_dir = tempfile.TemporaryDirectory(prefix="zora-")
+    log_config_path = os.path.join(config_dir.name, "logging.json")
+    with open(log_config_path, "w") as f:
+        json.dump(LOGGING_CONFIG, f)
+    
+    commands = {
+        "fastapi": build_uvicorn_command(
+            "app.main:app", DEFAULT_HOST, DEFAULT_PORT, FASTAPI_WORKERS, log_config_path
+        ),
+    }
+    if a2a_enabled:
+        commands["a2a"] = build_uvicorn_command(
+            "app.a2a_server:create_default_a2a_server", A2A_HOST, A2A_PORT, A2A_WORKERS, log_config_path,
+            factory=True,
+        )
+    
+    processes = {}
+    try:
+        for name, command in commands.items():
+            logger.info(f"Starting {name} server process: {' '.join(command[2:])}")
+            processes[name] = await asyncio.create_subprocess_exec(*command)
+        
+        # Wait until either server process exits, then stop the other one
+        waiters = {
+            asyncio.create_task(process.wait(), name=name): name
+            for name, process in processes.items()
+        }
+        done, _ = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in done:
+            logger.error(f"💥 {waiters[waiter]} server exited with code {waiter.result()}")
+    finally:
+        for process in processes.values():
+            if process.returncode is None:
+                process.terminate()
+        for process in processes.values():
+            await process.wait()
+        config_dir.cleanup()
+
+
 async def main():
     """Run both servers concurrently."""
     logger.info("🚀 Starting ZORA Ultimate AI Assistant")
@@ -200,49 +288,47 @@ async def main():
         if not ngrok_success:
             logger.warning("⚠️ Ngrok setup failed, continuing without ngrok")
     
+    # Download the MCP server packages once here rather than in every server
+    # worker, in the background so the servers start right away
+    prefetch_task = asyncio.create_task(prefetch_mcp_packages()) if MCP_PREFETCH_PACKAGES else None
+    
     try:
-        # Prepare server tasks
-        server_tasks = [run_fastapi_server()]
-        
-        # Only add A2A server if enabled
-        if a2a_enabled:
-            server_tasks.append(run_a2a_server())
-        
-        # Run servers concurrently
-        results = await asyncio.gather(*server_tasks, return_exceptions=True)
+        # Worker processes are opt-in, since per-process caches aren't shared between them
+        if FASTAPI_WORKERS > 1:
+            await run_worker_servers(a2a_enabled)
+        else:
+            await run_servers_in_process(a2a_enabled)
         
-        # Check for any exceptions in the results
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Server {i} failed with exception: {result}")
-                
     except KeyboardInterrupt:
         logger.info("👋 Shutting down servers...")
         # Clean up ngrok
         await cleanup_ngrok()
-        # Give a moment for cleanup
-        await asyncio.sleep(1.0)
+    except ExceptionGroup as eg:
+        # Log every server failure collected by the TaskGroup
+        for exc in eg.exceptions:
+            logger.error(f"💥 Server failed with exception: {exc}")
     except Exception as e:
         logger.error(f"💥 Error running servers: {e}")
         # Clean up ngrok
         await cleanup_ngrok()
         raise
     finally:
+        if prefetch_task is not None and not prefetch_task.done():
+            prefetch_task.cancel()
         # Ensure ngrok is cleaned up
         await cleanup_ngrok()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # Both servers share this loop unless they run as worker processes, so run it on uvloop when available
+        if uvloop is not None:
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except KeyboardInterrupt:
         logger.info("👋 Application stopped by user")
     except Exception as e:
         logger.error(f"💥 Failed to start application: {e}")
-        # Ensure ngrok cleanup even on startup failure
-        if ngrok_process:
-            try:
-                ngrok_process.terminate()
-            except:
-                pass
+        # The ngrok tunnel is owned by this process and closes when it exits
         exit(1)
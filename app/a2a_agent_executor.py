@@ -1,6 +1,8 @@
 import asyncio
+import base64
 import logging
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterable, Iterator
+from typing import Optional
 
 from a2a.server.agent_execution import AgentExecutor
 from a2a.server.agent_execution.context import RequestContext
@@ -18,22 +20,92 @@ from a2a.types import (
 from a2a.utils.errors import ServerError
 from google.adk import Runner
 from google.adk.events import Event
+from google.adk.sessions import Session
 from google.genai import types
 
+from .config import A2A_STATUS_COALESCE_WINDOW
+
 logger = logging.getLogger(__name__)
 # Reduced logging level from DEBUG to INFO to reduce verbosity
 logger.setLevel(logging.INFO)
 
+# Maximum number of ADK events buffered ahead of the A2A event queue
+_EVENT_QUEUE_SIZE = 64
+
+
+class _StatusCoalescer:
+    """Buffers intermediate A2A parts and sends them as one working status update per window."""
+
+    def __init__(self, task_updater: TaskUpdater, window: float):
+        self._task_updater = task_updater
+        self._window = window
+        self._pending: list[Part] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Timed sends that have started, awaited before any terminal update
+        self._send_tasks: set[asyncio.Task] = set()
+        # Keeps updates in order when a timed flush and an explicit flush overlap
+        self._send_lock = asyncio.Lock()
+
+    def add(self, parts: Iterable[Part]) -> None:
+        """Buffer parts, scheduling a flush at the end of the current window."""
+        self._pending.extend(parts)
+        if self._pending and self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._window, self._start_timed_send)
+
+    async def flush(self) -> None:
+        """Send any buffered parts now, after any timed send already in progress."""
+        await self._stop_timed_sends()
+        await self._send()
+
+    async def close(self) -> None:
+        """Drop buffered parts and wait out any timed send, so no working update follows a terminal one."""
+        await self._stop_timed_sends()
+        self._pending.clear()
+
+    def _start_timed_send(self) -> None:
+        self._timer = None
+        task = asyncio.create_task(self._send())
+        self._send_tasks.add(task)
+        task.add_done_callback(self._timed_send_done)
+
+    def _timed_send_done(self, task: asyncio.Task) -> None:
+        self._send_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("💥 Failed to send coalesced status update: %s", task.exception())
+
+    async def _stop_timed_sends(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._send_tasks:
+            # Errors are logged by _timed_send_done
+            await asyncio.wait(self._send_tasks)
+
+    async def _send(self) -> None:
+        async with self._send_lock:
+            if not self._pending:
+                return
+            parts, self._pending = self._pending, []
+            await self._task_updater.update_status(
+                TaskState.working,
+                message=self._task_updater.new_agent_message(parts),
+            )
+
 
 class ZoraAgentExecutor(AgentExecutor):
     """An AgentExecutor that runs ZORA's ADK-based Assistant."""
 
     def __init__(self, runner: Runner):
         self.runner = runner
-        self._running_sessions = {}
+        self._session_locks: dict[str, asyncio.Lock] = {}
+        self._session_cache: dict[str, Session] = {}
         logger.info("🚀 ZoraAgentExecutor initialized")
-        logger.info(f"   - AgentExecutor base class: {AgentExecutor}")
-        logger.info(f"   - Available methods: {[method for method in dir(self) if not method.startswith('_') and callable(getattr(self, method))]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("   - AgentExecutor base class: %s", AgentExecutor)
+            logger.debug(
+                "   - Available methods: %s",
+                [method for method in dir(self) if not method.startswith('_') and callable(getattr(self, method))],
+            )
 
     def _run_agent(
         self, session_id, new_message: types.Content, user_id: str = "a2a_client"
@@ -42,6 +114,22 @@ class ZoraAgentExecutor(AgentExecutor):
             session_id=session_id, user_id=user_id, new_message=new_message
         )
 
+    async def _produce_events(
+        self,
+        events: asyncio.Queue,
+        session_id: str,
+        new_message: types.Content,
+        user_id: str,
+    ) -> None:
+        """Put ADK events on the queue, followed by None once the runner is done."""
+        try:
+            async for event in self._run_agent(session_id, new_message, user_id):
+                await events.put(event)
+        except Exception:
+            await events.put(None)
+            raise
+        await events.put(None)
+
     async def _process_request(
         self,
         new_message: types.Content,
@@ -52,69 +140,82 @@ class ZoraAgentExecutor(AgentExecutor):
         try:
             session_obj = await self._upsert_session(session_id, user_id)
             session_id = session_obj.id
-            logger.info(f"📍 Processing request for session: {session_id}")
+            logger.info("📍 Processing request for session: %s", session_id)
+
+            # Drain ADK events in a background task so the runner keeps
+            # generating while we push updates to the A2A event queue
+            events: asyncio.Queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+            producer = asyncio.create_task(
+                self._produce_events(events, session_id, new_message, user_id)
+            )
+
+            # Intermediate updates are coalesced into one working status per window
+            status_updates = _StatusCoalescer(task_updater, A2A_STATUS_COALESCE_WINDOW)
+
+            # Bind per-request lookups once instead of on every event
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            add_status_parts = status_updates.add
+            to_a2a = iter_genai_parts_to_a2a
 
             event_count = 0
-            async for event in self._run_agent(session_id, new_message, user_id):
-                event_count += 1
-                logger.info(f"🔄 Processing ADK event #{event_count}: author={event.author}, has_content={event.content is not None}, final={event.is_final_response()}")
+            try:
+                while (event := await events.get()) is not None:
+                    event_count += 1
+                    event_parts = event.content.parts if event.content and event.content.parts else ()
                 
-                # Log event content details
-                if event.content:
-                    logger.debug(f"Event content parts: {len(event.content.parts) if event.content.parts else 0}")
-                    if event.content.parts:
-                        for i, part in enumerate(event.content.parts):
-                            if hasattr(part, 'text') and part.text:
-                                logger.debug(f"Part {i}: text='{part.text[:100]}...'")
-                            else:
-                                logger.debug(f"Part {i}: type={type(part)}")
+                    # Per-event details are only built when debug logging is on
+                    if debug_enabled:
+                        logger.debug(
+                            "🔄 Processing ADK event #%d: author=%s, has_content=%s, final=%s",
+                            event_count, event.author, event.content is not None, event.is_final_response(),
+                        )
+                        if event.content:
+                            logger.debug("Event content parts: %d", len(event_parts))
+                            for i, part in enumerate(event_parts):
+                                if hasattr(part, 'text') and part.text:
+                                    logger.debug("Part %d: text='%s...'", i, part.text[:100])
+                                else:
+                                    logger.debug("Part %d: type=%s", i, type(part))
                 
-                if event.is_final_response():
-                    parts = convert_genai_parts_to_a2a(
-                        event.content.parts if event.content and event.content.parts else []
-                    )
-                    logger.info(f"✅ Final response with {len(parts)} parts")
-                    if len(parts) == 0:
-                        logger.warning("⚠️ Final response has no parts! Creating default response.")
-                        # Create a default text response if no parts are returned
-                        from a2a.types import TextPart, Part
-                        default_part = Part(root=TextPart(text="I'm sorry, I couldn't generate a proper response. Please try again."))
-                        parts = [default_part]
-                    else:
-                        for i, p in enumerate(parts):
-                            if hasattr(p.root, 'text'):
-                                logger.debug(f"Response part {i}: {p.root.text[:100]}...")
-                            else:
-                                logger.debug(f"Response part {i}: {type(p.root)}")
+                    if event.is_final_response():
+                        parts = list(to_a2a(event_parts))
+                        logger.info("✅ Final response with %d parts", len(parts))
+                        if len(parts) == 0:
+                            logger.warning("⚠️ Final response has no parts! Creating default response.")
+                            # Create a default text response if no parts are returned
+                            default_part = Part(root=TextPart(text="I'm sorry, I couldn't generate a proper response. Please try again."))
+                            parts = [default_part]
+                        elif debug_enabled:
+                            for i, p in enumerate(parts):
+                                if hasattr(p.root, 'text'):
+                                    logger.debug("Response part %d: %s...", i, p.root.text[:100])
+                                else:
+                                    logger.debug("Response part %d: %s", i, type(p.root))
                     
-                    await task_updater.add_artifact(parts)
-                    await task_updater.complete()
-                    break
+                        await status_updates.flush()
+                        await task_updater.add_artifact(parts)
+                        await task_updater.complete()
+                        break
                     
-                if not event.get_function_calls():
-                    logger.info("📤 Intermediate response update")
-                    await task_updater.update_status(
-                        TaskState.working,
-                        message=task_updater.new_agent_message(
-                            convert_genai_parts_to_a2a(
-                                event.content.parts
-                                if event.content and event.content.parts
-                                else []
-                            ),
-                        ),
-                    )
+                    if debug_enabled:
+                        function_calls = event.get_function_calls()
+                        if not function_calls:
+                            logger.debug("📤 Intermediate response update")
+                        else:
+                            logger.debug("🔧 Function call event: %s", [call.name for call in function_calls])
+                    add_status_parts(to_a2a(event_parts))
                 else:
-                    logger.info(f"🔧 Function call event: {[call.name for call in event.get_function_calls()]}")
-                    await task_updater.update_status(
-                        TaskState.working,
-                        message=task_updater.new_agent_message(
-                            convert_genai_parts_to_a2a(
-                                event.content.parts
-                                if event.content and event.content.parts
-                                else []
-                            ),
-                        ),
-                    )
+                    # Runner finished - surface any error it raised
+                    await producer
+                    await status_updates.flush()
+            finally:
+                await status_updates.close()
+                if not producer.done():
+                    producer.cancel()
+                    try:
+                        await producer
+                    except asyncio.CancelledError:
+                        pass
                     
             if event_count == 0:
                 logger.warning("⚠️ No events received from agent runner")
@@ -124,8 +225,10 @@ class ZoraAgentExecutor(AgentExecutor):
                 )
                 
         except Exception as e:
-            logger.error(f"💥 Error in _process_request: {str(e)}", exc_info=True)
+            logger.error("💥 Error in _process_request: %s", e, exc_info=True)
             raise
+        finally:
+            self._release_session(session_id)
 
     async def execute(
         self,
@@ -133,8 +236,8 @@ class ZoraAgentExecutor(AgentExecutor):
         event_queue: EventQueue,
     ) -> None:
         logger.info("🚀 A2A Agent Executor: Starting execute method")
-        logger.info(f"📋 Context: task_id={context.task_id}, context_id={context.context_id}")
-        logger.info(f"📝 Message parts: {len(context.message.parts) if context.message else 0}")
+        logger.info("📋 Context: task_id=%s, context_id=%s", context.task_id, context.context_id)
+        logger.info("📝 Message parts: %d", len(context.message.parts) if context.message else 0)
         
         if not context.task_id or not context.context_id:
             logger.error("❌ Missing task_id or context_id")
@@ -150,11 +253,11 @@ class ZoraAgentExecutor(AgentExecutor):
         
         # Create or get the task - this is the key step we were missing!
         task = context.current_task or new_task(context.message)
-        logger.info(f"📤 Task created/retrieved: {task.id}")
+        logger.info("📤 Task created/retrieved: %s", task.id)
         
         # Enqueue the task event - this is crucial for task to be found in store
         await event_queue.enqueue_event(task)
-        logger.info(f"📤 Task enqueued to event_queue: {task.id}")
+        logger.info("📤 Task enqueued to event_queue: %s", task.id)
         
         # Now create TaskUpdater with the task that exists in the store
         # Use the correct property name for context_id
@@ -169,11 +272,11 @@ class ZoraAgentExecutor(AgentExecutor):
             
             # Use a default user_id for A2A requests, or extract from context if available
             user_id = getattr(context, 'user_id', 'a2a_client')
-            logger.info(f"👤 Using user_id: {user_id}")
+            logger.info("👤 Using user_id: %s", user_id)
             
             logger.info("🔄 Converting A2A parts to GenAI format")
             genai_parts = convert_a2a_parts_to_genai(context.message.parts)
-            logger.info(f"🔄 Converted {len(genai_parts)} parts")
+            logger.info("🔄 Converted %d parts", len(genai_parts))
             
             logger.info("🎯 Starting _process_request")
             await self._process_request(
@@ -186,7 +289,7 @@ class ZoraAgentExecutor(AgentExecutor):
             logger.info("🎯 Completed A2A request processing successfully")
             
         except Exception as e:
-            logger.error(f"💥 Error during A2A request processing: {str(e)}", exc_info=True)
+            logger.error("💥 Error during A2A request processing: %s", e, exc_info=True)
             # Ensure we send an error response to the client
             await updater.update_status(
                 TaskState.failed,
@@ -197,82 +300,154 @@ class ZoraAgentExecutor(AgentExecutor):
     async def cancel(self, context: RequestContext, event_queue: EventQueue):
         raise ServerError(error=UnsupportedOperationError())
 
-    async def _upsert_session(self, session_id: str, user_id: str = "a2a_client"):
-        session = await self.runner.session_service.get_session(
-            app_name=self.runner.app_name, user_id=user_id, session_id=session_id
+    async def _upsert_session(self, session_id: str, user_id: str = "a2a_client") -> Session:
+        session = self._session_cache.get(session_id)
+        if session is not None:
+            return session
+
+        # Serialize get-or-create per session so concurrent requests for the
+        # same context don't both create it
+        lock = self._session_locks.setdefault(session_id, asyncio.Lock())
+        async with lock:
+            session = self._session_cache.get(session_id)
+            if session is not None:
+                return session
+
+            session = await self.runner.session_service.get_session(
+                app_name=self.runner.app_name, user_id=user_id, session_id=session_id
+            )
+            if session is None:
+                session = await self.runner.session_service.create_session(
+                    app_name=self.runner.app_name,
+                    user_id=user_id,
+                    session_id=session_id,
+                )
+            if session is None:
+                raise RuntimeError(f"Failed to get or create session: {session_id}")
+            self._session_cache[session_id] = session
+            return session
+
+    def _release_session(self, session_id: str) -> None:
+        """Drop the cached session and its lock once a request is done with it."""
+        self._session_cache.pop(session_id, None)
+        lock = self._session_locks.get(session_id)
+        if lock is not None and not lock.locked():
+            del self._session_locks[session_id]
+
+
+def _text_part_to_genai(root: TextPart) -> types.Part:
+    return types.Part(text=root.text)
+
+
+def _file_part_to_genai(root: FilePart) -> types.Part:
+    if isinstance(root.file, FileWithUri):
+        return types.Part(
+            file_data=types.FileData(
+                file_uri=root.file.uri, mime_type=root.file.mimeType
+            )
+        )
+    if isinstance(root.file, FileWithBytes):
+        return types.Part(
+            inline_data=types.Blob(
+                # A2A carries file bytes as a base64 string
+                data=base64.b64decode(root.file.bytes),
+                mime_type=root.file.mimeType or "application/octet-stream",
+            )
         )
-        if session is None:
-            session = await self.runner.session_service.create_session(
-                app_name=self.runner.app_name,
-                user_id=user_id,
-                session_id=session_id,
+    raise ValueError(f"Unsupported file type: {type(root.file)}")
+
+
+def _text_to_a2a(part: types.Part) -> Part:
+    return Part(root=TextPart(text=part.text))
+
+
+def _file_data_to_a2a(part: types.Part) -> Part:
+    if not part.file_data.file_uri:
+        raise ValueError("File URI is missing")
+    return Part(
+        root=FilePart(
+            file=FileWithUri(
+                uri=part.file_data.file_uri,
+                mimeType=part.file_data.mime_type,
             )
-        if session is None:
-            raise RuntimeError(f"Failed to get or create session: {session_id}")
-        return session
+        )
+    )
+
+
+def _inline_data_to_a2a(part: types.Part) -> Part:
+    if not part.inline_data.data:
+        raise ValueError("Inline data is missing")
+    return Part(
+        root=FilePart(
+            file=FileWithBytes(
+                bytes=base64.b64encode(part.inline_data.data).decode("ascii"),
+                mimeType=part.inline_data.mime_type,
+            )
+        )
+    )
+
+
+# A2A part root type -> converter
+_A2A_TO_GENAI = {
+    TextPart: _text_part_to_genai,
+    FilePart: _file_part_to_genai,
+}
+
+# GenAI part field -> converter, checked in order
+_GENAI_TO_A2A = (
+    ("text", _text_to_a2a),
+    ("file_data", _file_data_to_a2a),
+    ("inline_data", _inline_data_to_a2a),
+)
+
+
+def _genai_to_a2a_converter(part: types.Part):
+    """Return the converter for the first populated field of a GenAI part, if any."""
+    for field, converter in _GENAI_TO_A2A:
+        if getattr(part, field):
+            return converter
+    return None
+
+
+def iter_a2a_parts_to_genai(parts: Iterable[Part]) -> Iterator[types.Part]:
+    """Lazily convert A2A Part types into Google Gen AI Part types."""
+    for part in parts:
+        yield convert_a2a_part_to_genai(part)
 
 
 def convert_a2a_parts_to_genai(parts: list[Part]) -> list[types.Part]:
     """Convert a list of A2A Part types into a list of Google Gen AI Part types."""
-    return [convert_a2a_part_to_genai(part) for part in parts]
+    return list(iter_a2a_parts_to_genai(parts))
 
 
 def convert_a2a_part_to_genai(part: Part) -> types.Part:
     """Convert a single A2A Part type into a Google Gen AI Part type."""
     root = part.root
-    if isinstance(root, TextPart):
-        return types.Part(text=root.text)
-    if isinstance(root, FilePart):
-        if isinstance(root.file, FileWithUri):
-            return types.Part(
-                file_data=types.FileData(
-                    file_uri=root.file.uri, mime_type=root.file.mimeType
-                )
-            )
-        if isinstance(root.file, FileWithBytes):
-            return types.Part(
-                inline_data=types.Blob(
-                    data=root.file.bytes.encode("utf-8"),
-                    mime_type=root.file.mimeType or "application/octet-stream",
-                )
-            )
-        raise ValueError(f"Unsupported file type: {type(root.file)}")
-    raise ValueError(f"Unsupported part type: {type(part)}")
+    try:
+        converter = _A2A_TO_GENAI[type(root)]
+    except KeyError:
+        raise ValueError(f"Unsupported part type: {type(part)}") from None
+    return converter(root)
+
+
+def iter_genai_parts_to_a2a(parts: Iterable[types.Part]) -> Iterator[Part]:
+    """Lazily convert Google Gen AI Part types into A2A Part types."""
+    for part in parts:
+        # Parts without text, file data or inline data are skipped
+        converter = _genai_to_a2a_converter(part)
+        if converter is None:
+            continue
+        yield converter(part)
 
 
 def convert_genai_parts_to_a2a(parts: list[types.Part]) -> list[Part]:
     """Convert a list of Google Gen AI Part types into a list of A2A Part types."""
-    return [
-        convert_genai_part_to_a2a(part)
-        for part in parts
-        if (part.text or part.file_data or part.inline_data)
-    ]
+    return list(iter_genai_parts_to_a2a(parts))
 
 
 def convert_genai_part_to_a2a(part: types.Part) -> Part:
     """Convert a single Google Gen AI Part type into an A2A Part type."""
-    if part.text:
-        return Part(root=TextPart(text=part.text))
-    if part.file_data:
-        if not part.file_data.file_uri:
-            raise ValueError("File URI is missing")
-        return Part(
-            root=FilePart(
-                file=FileWithUri(
-                    uri=part.file_data.file_uri,
-                    mimeType=part.file_data.mime_type,
-                )
-            )
-        )
-    if part.inline_data:
-        if not part.inline_data.data:
-            raise ValueError("Inline data is missing")
-        return Part(
-            root=FilePart(
-                file=FileWithBytes(
-                    bytes=part.inline_data.data.decode("utf-8"),
-                    mimeType=part.inline_data.mime_type,
-                )
-            )
-        )
-    raise ValueError(f"Unsupported part type: {part}")
+    converter = _genai_to_a2a_converter(part)
+    if converter is None:
+        raise ValueError(f"Unsupported part type: {part}")
+    return converter(part)
@@ -4,83 +4,273 @@ Manages connections to other A2A agents that ZORA can communicate with.
 """
 
 import asyncio
-import json
 import logging
+import os
 import uuid
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-from a2a.client import A2ACardResolver, A2AClient
+import orjson
+from a2a.client import A2ACardResolver, A2AClient, A2AClientHTTPError
 from a2a.types import (
     AgentCard,
+    Message,
     MessageSendParams,
+    Part,
+    Role,
     SendMessageRequest,
     SendMessageResponse,
     SendMessageSuccessResponse,
     Task,
+    TextPart,
 )
 
-from .config import A2A_AGENT_URLS, A2A_CONNECTION_TIMEOUT
+from .config import (
+    A2A_AGENT_URLS,
+    A2A_CONNECTION_TIMEOUT,
+    A2A_DISCOVERY_CONCURRENCY,
+    A2A_DISCOVERY_TIMEOUT,
+    A2A_HEALTH_CHECK_FAILURES,
+    A2A_HEALTH_CHECK_INTERVAL,
+    A2A_HEALTH_CHECK_TIMEOUT,
+    A2A_MAX_AGENTS,
+    A2A_RETRY_ATTEMPTS,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# HTTP client shared by discovery and all remote agent connections, so
+# requests to the same host reuse pooled keep-alive connections
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _shared_client
+    
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=A2A_CONNECTION_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60.0,
+            ),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client."""
+    global _shared_client
+    
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+# Random bytes for message and context IDs are drawn from os.urandom in
+# batches, so generating an ID doesn't cost a syscall every time
+_ID_POOL_BYTES = 4096
+_id_pool = b""
+_id_pool_offset = 0
+
+
+def _new_id() -> str:
+    """Generate a random (version 4) UUID as a 32-character hex string."""
+    global _id_pool, _id_pool_offset
+    
+    if _id_pool_offset >= len(_id_pool):
+        _id_pool = os.urandom(_ID_POOL_BYTES)
+        _id_pool_offset = 0
+    id_bytes = _id_pool[_id_pool_offset:_id_pool_offset + 16]
+    _id_pool_offset += 16
+    return uuid.UUID(bytes=id_bytes, version=4).hex
+
+
 class RemoteAgentConnection:
     """A connection to a single remote A2A agent."""
 
-    def __init__(self, agent_card: AgentCard, agent_url: str):
+    def __init__(
+        self,
+        agent_card: AgentCard,
+        agent_url: str,
+        httpx_client: Optional[httpx.AsyncClient] = None,
+    ):
         self.agent_card = agent_card
         self.agent_url = agent_url
-        timeout = A2A_CONNECTION_TIMEOUT
-        self._httpx_client = httpx.AsyncClient(timeout=timeout)
-        self.agent_client = A2AClient(self._httpx_client, agent_card, url=agent_url)
-        logger.info(f"✅ Created connection to {agent_card.name} at {agent_url}")
+        httpx_client = httpx_client or _get_shared_client()
+        self.agent_client = A2AClient(httpx_client, agent_card, url=agent_url)
+        logger.info("✅ Created connection to %s at %s", agent_card.name, agent_url)
 
     async def send_message(self, message_request: SendMessageRequest) -> SendMessageResponse:
         """Send a message to the remote agent."""
         return await self.agent_client.send_message(message_request)
 
     async def close(self):
-        """Close the HTTP client connection."""
-        await self._httpx_client.aclose()
+        """Release the connection. The shared HTTP client is closed separately."""
 
 
 class RemoteAgentManager:
     """Manages connections to multiple remote A2A agents."""
 
     def __init__(self):
-        self.connections: Dict[str, RemoteAgentConnection] = {}
-        self.agent_cards: Dict[str, AgentCard] = {}
+        # Ordered from least to most recently used, capped at A2A_MAX_AGENTS
+        self.connections: OrderedDict[str, RemoteAgentConnection] = OrderedDict()
+        self.agent_cards: OrderedDict[str, AgentCard] = OrderedDict()
+        self._health_check_failures: Dict[str, int] = {}
+        self._health_check_task: Optional[asyncio.Task] = None
         logger.info("🔗 RemoteAgentManager initialized")
 
-    async def discover_and_connect_agents(self, agent_urls: List[str]) -> None:
+    async def discover_and_connect_agents(
+        self, agent_urls: List[str], max_concurrency: int = A2A_DISCOVERY_CONCURRENCY
+    ) -> None:
         """
         Discover and connect to agents at the given URLs.
         
         Args:
             agent_urls: List of URLs where A2A agents are running
+            max_concurrency: Maximum number of agent card requests in flight at once
         """
-        logger.info(f"🔍 Discovering agents at {len(agent_urls)} URLs...")
+        logger.info("🔍 Discovering agents at %d URLs...", len(agent_urls))
         
-        async with httpx.AsyncClient(timeout=A2A_CONNECTION_TIMEOUT) as client:
-            for url in agent_urls:
-                try:
-                    logger.info(f"🔍 Discovering agent at {url}...")
-                    card_resolver = A2ACardResolver(client, url)
-                    card = await card_resolver.get_agent_card()
-                    
-                    connection = RemoteAgentConnection(agent_card=card, agent_url=url)
-                    self.connections[card.name] = connection
-                    self.agent_cards[card.name] = card
-                    
-                    logger.info(f"✅ Connected to {card.name}: {card.description}")
-                    
-                except httpx.ConnectError as e:
-                    logger.warning(f"⚠️ Failed to connect to agent at {url}: {e}")
-                except Exception as e:
-                    logger.error(f"💥 Error discovering agent at {url}: {e}")
+        client = _get_shared_client()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def probe(url: str) -> Tuple[str, Optional[AgentCard]]:
+            async with semaphore:
+                return await self._discover_one(client, url)
+        
+        # Probe URLs concurrently so one unreachable host doesn't delay the rest,
+        # but cap the fan-out so large URL lists don't flood the network
+        results = await asyncio.gather(*(probe(url) for url in agent_urls), return_exceptions=True)
+        
+        # Register connections serially once all probes are done
+        for url, result in zip(agent_urls, results):
+            if isinstance(result, BaseException):
+                logger.error("💥 Error discovering agent at %s: %s", url, result)
+                continue
+            card = result[1]
+            if card is None:
+                continue
+            connection = RemoteAgentConnection(agent_card=card, agent_url=url, httpx_client=client)
+            await self._register(card, connection)
+            
+            logger.info("✅ Connected to %s: %s", card.name, card.description)
+
+        logger.info("🔗 Connected to %d agents", len(self.connections))
+
+    async def _discover_one(
+        self, client: httpx.AsyncClient, url: str
+    ) -> Tuple[str, Optional[AgentCard]]:
+        """Fetch the agent card at a URL, returning None for the card on failure.
+        
+        Network errors, timeouts and 5xx responses are retried with exponential backoff.
+        """
+        logger.info("🔍 Discovering agent at %s...", url)
+        card_resolver = A2ACardResolver(client, url)
+        for attempt in range(A2A_RETRY_ATTEMPTS):
+            try:
+                card = await asyncio.wait_for(
+                    card_resolver.get_agent_card(), timeout=A2A_DISCOVERY_TIMEOUT
+                )
+                return url, card
+                
+            except A2AClientHTTPError as e:
+                # The resolver reports network errors as 503s; 4xx responses won't succeed on retry
+                if e.status_code < 500:
+                    logger.warning("⚠️ Failed to fetch agent card at %s: %s", url, e)
+                    break
+                error: object = e
+            except asyncio.TimeoutError:
+                error = f"timed out after {A2A_DISCOVERY_TIMEOUT}s"
+            except Exception as e:
+                logger.error("💥 Error discovering agent at %s: %s", url, e)
+                break
+
+            logger.debug(
+                "Discovery attempt %d/%d for %s failed: %s",
+                attempt + 1, A2A_RETRY_ATTEMPTS, url, error,
+            )
+            if attempt + 1 == A2A_RETRY_ATTEMPTS:
+                logger.warning("⚠️ Failed to connect to agent at %s: %s", url, error)
+                break
+            await asyncio.sleep(min(2 ** attempt * 0.25, 4.0))
+        return url, None
 
-        logger.info(f"🔗 Connected to {len(self.connections)} agents")
+    async def _register(self, card: AgentCard, connection: RemoteAgentConnection) -> None:
+        """Add a connection as most recently used, evicting the least recently used past the cap."""
+        self.connections[card.name] = connection
+        self.agent_cards[card.name] = card
+        self.connections.move_to_end(card.name)
+        self.agent_cards.move_to_end(card.name)
+        self._health_check_failures.pop(card.name, None)
+        
+        while len(self.connections) > A2A_MAX_AGENTS:
+            evicted_name = next(iter(self.connections))
+            logger.info("♻️ Evicting least recently used agent %s", evicted_name)
+            await self._evict(evicted_name)
+
+    async def _evict(self, agent_name: str) -> None:
+        """Remove an agent and close its connection."""
+        connection = self.connections.pop(agent_name, None)
+        self.agent_cards.pop(agent_name, None)
+        self._health_check_failures.pop(agent_name, None)
+        if connection is not None:
+            try:
+                await connection.close()
+            except Exception as e:
+                logger.warning("Warning: Error closing connection: %s", e)
+
+    async def _check_agent(self, client: httpx.AsyncClient, url: str) -> bool:
+        """Return whether the agent card at a URL can still be fetched."""
+        try:
+            await asyncio.wait_for(
+                A2ACardResolver(client, url).get_agent_card(), timeout=A2A_HEALTH_CHECK_TIMEOUT
+            )
+            return True
+        except Exception as e:
+            logger.debug("Health check for %s failed: %s", url, e)
+            return False
+
+    async def prune_dead(self) -> None:
+        """Ping every connected agent and evict those failing repeated health checks."""
+        client = _get_shared_client()
+        names = list(self.connections)
+        results = await asyncio.gather(
+            *(self._check_agent(client, self.connections[name].agent_url) for name in names)
+        )
+        
+        for name, healthy in zip(names, results):
+            if name not in self.connections:
+                continue
+            if healthy:
+                self._health_check_failures.pop(name, None)
+                continue
+            failures = self._health_check_failures.get(name, 0) + 1
+            self._health_check_failures[name] = failures
+            if failures >= A2A_HEALTH_CHECK_FAILURES:
+                logger.warning("⚠️ Evicting unreachable agent %s after %d failed health checks", name, failures)
+                await self._evict(name)
+
+    async def _health_check_loop(self) -> None:
+        """Periodically prune agents that have gone offline."""
+        while True:
+            await asyncio.sleep(A2A_HEALTH_CHECK_INTERVAL)
+            try:
+                await self.prune_dead()
+            except Exception as e:
+                logger.warning("⚠️ Agent health check failed: %s", e)
+            logger.debug("Tracking %d remote agent connections", len(self.connections))
+
+    def start_health_checks(self) -> None:
+        """Start the background health check loop if it is not already running."""
+        if self._health_check_task is None or self._health_check_task.done():
+            self._health_check_task = asyncio.create_task(
+                self._health_check_loop(), name="a2a-agent-health-check"
+            )
 
     def get_available_agents(self) -> List[str]:
         """Get list of available agent names."""
@@ -98,7 +288,7 @@ class RemoteAgentManager:
                 "description": card.description,
                 "skills": [skill.name for skill in card.skills] if card.skills else []
             }
-            agent_info.append(json.dumps(info, indent=2))
+            agent_info.append(orjson.dumps(info, option=orjson.OPT_INDENT_2).decode())
         
         return "\\n\\n".join(agent_info)
 
@@ -126,68 +316,82 @@ class RemoteAgentManager:
             )
 
         connection = self.connections[agent_name]
+        # Mark the agent as most recently used
+        self.connections.move_to_end(agent_name)
+        self.agent_cards.move_to_end(agent_name)
         
         # Generate IDs if not provided
         if not context_id:
-            context_id = str(uuid.uuid4())
-        message_id = str(uuid.uuid4())
-
-        # Create the message payload - let server generate taskId
-        payload = {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": message_id,
-                "contextId": context_id,
-            },
-        }
+            context_id = _new_id()
+        message_id = _new_id()
+
+        # Build the typed message directly - let server generate taskId
+        outgoing_message = Message(
+            role=Role.user,
+            parts=[Part(root=TextPart(text=message))],
+            messageId=message_id,
+            contextId=context_id,
+        )
 
+        # The message is already validated, so skip revalidating the params wrapper
         message_request = SendMessageRequest(
             id=message_id, 
-            params=MessageSendParams.model_validate(payload)
+            params=MessageSendParams.model_construct(message=outgoing_message)
         )
 
         try:
-            logger.info(f"📤 Sending message to {agent_name}: {message[:100]}...")
+            logger.info("📤 Sending message to %s: %s...", agent_name, message[:100])
             send_response: SendMessageResponse = await connection.send_message(message_request)
             
             if not isinstance(send_response.root, SendMessageSuccessResponse) or not isinstance(send_response.root.result, Task):
                 logger.warning("Received a non-success or non-task response")
                 return []
 
-            # Extract response content
-            response_content = send_response.root.model_dump_json(exclude_none=True)
-            json_content = json.loads(response_content)
+            # Extract response content - dump only the artifact parts, not the whole envelope
+            task: Task = send_response.root.result
 
             response_parts = []
-            if json_content.get("result", {}).get("artifacts"):
-                for artifact in json_content["result"]["artifacts"]:
-                    if artifact.get("parts"):
-                        response_parts.extend(artifact["parts"])
+            for artifact in task.artifacts or []:
+                response_parts.extend(
+                    part.model_dump(mode="json", exclude_none=True) for part in artifact.parts or []
+                )
 
-            logger.info(f"📥 Received {len(response_parts)} response parts from {agent_name}")
+            logger.info("📥 Received %d response parts from %s", len(response_parts), agent_name)
             return response_parts
 
         except Exception as e:
-            logger.error(f"💥 Error sending message to {agent_name}: {e}")
+            logger.error("💥 Error sending message to %s: %s", agent_name, e)
             raise
 
     async def close_all_connections(self):
         """Close all agent connections."""
         logger.info("🔐 Closing all remote agent connections...")
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            self._health_check_task = None
+        
         for connection in self.connections.values():
             try:
                 await connection.close()
             except Exception as e:
-                logger.warning(f"Warning: Error closing connection: {e}")
+                logger.warning("Warning: Error closing connection: %s", e)
         
         self.connections.clear()
         self.agent_cards.clear()
+        self._health_check_failures.clear()
+        await close_shared_client()
         logger.info("✅ All connections closed")
 
 
 # Global instance for the agent manager
 _remote_agent_manager: Optional[RemoteAgentManager] = None
+# Ensures concurrent first callers share a single discovery run
+_init_lock = asyncio.Lock()
+
+
+def get_remote_agent_manager_nowait() -> Optional[RemoteAgentManager]:
+    """Get the global remote agent manager if it is already initialized, without awaiting."""
+    return _remote_agent_manager
 
 
 async def get_remote_agent_manager() -> RemoteAgentManager:
@@ -195,14 +399,21 @@ async def get_remote_agent_manager() -> RemoteAgentManager:
     global _remote_agent_manager
     
     if _remote_agent_manager is None:
-        _remote_agent_manager = RemoteAgentManager()
-        
-        # Get A2A agent URLs from configuration
-        agent_urls = A2A_AGENT_URLS
-        
-        try:
-            await _remote_agent_manager.discover_and_connect_agents(agent_urls)
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to discover some agents: {e}")
+        async with _init_lock:
+            if _remote_agent_manager is None:
+                manager = RemoteAgentManager()
+                
+                # Get A2A agent URLs from configuration
+                agent_urls = A2A_AGENT_URLS
+                
+                try:
+                    await manager.discover_and_connect_agents(agent_urls)
+                except Exception as e:
+                    logger.warning("⚠️ Failed to discover some agents: %s", e)
+                
+                manager.start_health_checks()
+                
+                # Publish only once discovery has finished
+                _remote_agent_manager = manager
     
     return _remote_agent_manager
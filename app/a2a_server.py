@@ -4,11 +4,11 @@ This allows other agents to communicate with ZORA using the Agent-to-Agent proto
 """
 
 import logging
+import os
 from typing import Optional
 
 from a2a.server.apps import A2AStarletteApplication
 from a2a.server.request_handlers import DefaultRequestHandler
-from a2a.server.tasks import InMemoryTaskStore
 from a2a.types import (
     AgentCapabilities,
     AgentCard,
@@ -16,23 +16,162 @@ from a2a.types import (
 )
 from google.adk.artifacts import InMemoryArtifactService
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from starlette.applications import Starlette
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import URL, Headers
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import time
 
 from .a2a_agent_executor import ZoraAgentExecutor
+from .a2a_stores import BoundedSessionService, BoundedTaskStore
 from .assistant.agent import create_agent  # type: ignore
-from .assistant.utils.zep_memory_service import ZepMemoryService
-from .config import APP_NAME, A2A_SERVER_DEFAULT_USER, NGROK_URL, ACTIVATE_A2A_SERVER
-from typing import Optional
+from .assistant.utils.zep_memory_service import LazyZepMemoryService
+from .config import APP_NAME, A2A_HOST, A2A_PORT, A2A_SERVER_DEFAULT_USER, NGROK_URL, ACTIVATE_A2A_SERVER
+from .event_loop import use_eager_tasks
 
 logger = logging.getLogger(__name__)
 # Reduced logging level from DEBUG to INFO to reduce verbosity
 logger.setLevel(logging.INFO)
 
+# Maximum number of request body bytes captured for DEBUG logging
+_MAX_LOGGED_BODY_BYTES = 4096
+
+# Path the A2A SDK serves the agent card on
+_AGENT_CARD_PATH = "/.well-known/agent.json"
+
+
+# Agent capabilities - disable streaming for now to ensure completion
+_CAPABILITIES = AgentCapabilities(streaming=False)
+
+# Agent skills are static, so they are built once at import time
+_AGENT_SKILLS: tuple[AgentSkill, ...] = (
+    AgentSkill(
+        id="web_search",
+        name="Web Search & Research",
+        description="Search the web for information and provide detailed research.",
+        tags=["search", "research", "web"],
+        examples=["Search for the latest news about AI", "Research quantum computing"],
+    ),
+    AgentSkill(
+        id="document_processing",
+        name="Document Analysis",
+        description="Process, analyze and extract information from documents and images.",
+        tags=["documents", "analysis", "ocr"],
+        examples=["Analyze this PDF document", "Extract text from this image"],
+    ),
+    AgentSkill(
+        id="task_management",
+        name="Task & Project Management",
+        description="Manage tasks, projects, and to-do lists using Todoist integration.",
+        tags=["tasks", "productivity", "todoist"],
+        examples=["Add a task to my project", "Show my upcoming deadlines"],
+    ),
+    AgentSkill(
+        id="calendar_management",
+        name="Calendar Management",
+        description="Manage calendar events, scheduling, and availability using Google Calendar.",
+        tags=["calendar", "scheduling", "events"],
+        examples=["Schedule a meeting for tomorrow", "Check my availability next week"],
+    ),
+    AgentSkill(
+        id="email_management",
+        name="Email Management",
+        description="Read, compose, and manage emails using Gmail integration.",
+        tags=["email", "gmail", "communication"],
+        examples=["Check my latest emails", "Send an email to John"],
+    ),
+    AgentSkill(
+        id="memory_retrieval",
+        name="Conversation Memory",
+        description="Access and recall information from previous conversations and interactions.",
+        tags=["memory", "history", "context"],
+        examples=["What did we discuss yesterday?", "Remember my project preferences"],
+    ),
+)
+
+
+def _build_agent_card(url: str) -> AgentCard:
+    """Create the ZORA agent card for the given public URL from the static skills."""
+    return AgentCard(
+        name="ZORA Assistant",
+        description="ZORA is a comprehensive AI assistant with voice interaction, persistent memory, and real-world integrations including web search, document processing, task management, calendar, and email.",
+        url=url,
+        version="1.0.0",
+        default_input_modes=["text/plain"],
+        default_output_modes=["text/plain"],
+        capabilities=_CAPABILITIES,
+        skills=list(_AGENT_SKILLS),
+    )
+
+
+class StaticAgentCardApp:
+    """
+    ASGI app that serves an agent card serialized once up front, instead of
+    dumping the pydantic model on every discovery request.
+    """
+
+    def __init__(self, agent_card: AgentCard) -> None:
+        self.body = agent_card.model_dump_json(by_alias=True, exclude_none=True).encode()
+        self.headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(self.body)).encode()),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+        await send({"type": "http.response.body", "body": self.body})
+
+
+class DetailedLoggingMiddleware:
+    """
+    Pure ASGI middleware that logs one record per HTTP request with its response status and timing.
+    
+    Unlike BaseHTTPMiddleware, the response is passed straight through to the
+    server instead of being re-streamed through an intermediate task.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Pass through untouched when there is nothing to log, so no timer
+        # or send wrapper is set up for the request
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+
+        # Headers and a prefix of the POST body are only captured for DEBUG
+        # logging; the body is copied as the handler reads it, never re-parsed
+        body_prefix = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📥 Incoming %s request to %s", method, URL(scope=scope))
+            logger.debug("   - Headers: %r", dict(Headers(scope=scope)))
+            if method == "POST":
+                body_prefix = bytearray()
+                downstream_receive = receive
+
+                async def receive() -> Message:
+                    message = await downstream_receive()
+                    if message["type"] == "http.request":
+                        remaining = _MAX_LOGGED_BODY_BYTES - len(body_prefix)
+                        if remaining > 0:
+                            body_prefix.extend(message.get("body", b"")[:remaining])
+                    return message
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                logger.info("📤 %s %s -> %d %.3fs", method, path, message["status"], process_time)
+                if body_prefix is not None:
+                    logger.debug("   - Body: %r", bytes(body_prefix))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
 
 def create_a2a_server(host: str = "localhost", port: int = 10003, user_id: Optional[str] = None) -> Optional[Starlette]:
     """
@@ -55,79 +194,22 @@ def create_a2a_server(host: str = "localhost", port: int = 10003, user_id: Optio
     if user_id is None:
         user_id = A2A_SERVER_DEFAULT_USER
         
-    logger.info(f"🚀 Creating A2A server for ZORA on {host}:{port} with user_id: {user_id}")
+    logger.info("🚀 Creating A2A server for ZORA on %s:%s with user_id: %s", host, port, user_id)
     
     try:
-        # Define agent capabilities - disable streaming for now to ensure completion
-        capabilities = AgentCapabilities(streaming=False)
-        
-        # Define agent skills
-        skills = [
-            AgentSkill(
-                id="web_search",
-                name="Web Search & Research",
-                description="Search the web for information and provide detailed research.",
-                tags=["search", "research", "web"],
-                examples=["Search for the latest news about AI", "Research quantum computing"],
-            ),
-            AgentSkill(
-                id="document_processing",
-                name="Document Analysis",
-                description="Process, analyze and extract information from documents and images.",
-                tags=["documents", "analysis", "ocr"],
-                examples=["Analyze this PDF document", "Extract text from this image"],
-            ),
-            AgentSkill(
-                id="task_management",
-                name="Task & Project Management",
-                description="Manage tasks, projects, and to-do lists using Todoist integration.",
-                tags=["tasks", "productivity", "todoist"],
-                examples=["Add a task to my project", "Show my upcoming deadlines"],
-            ),
-            AgentSkill(
-                id="calendar_management",
-                name="Calendar Management",
-                description="Manage calendar events, scheduling, and availability using Google Calendar.",
-                tags=["calendar", "scheduling", "events"],
-                examples=["Schedule a meeting for tomorrow", "Check my availability next week"],
-            ),
-            AgentSkill(
-                id="email_management",
-                name="Email Management",
-                description="Read, compose, and manage emails using Gmail integration.",
-                tags=["email", "gmail", "communication"],
-                examples=["Check my latest emails", "Send an email to John"],
-            ),
-            AgentSkill(
-                id="memory_retrieval",
-                name="Conversation Memory",
-                description="Access and recall information from previous conversations and interactions.",
-                tags=["memory", "history", "context"],
-                examples=["What did we discuss yesterday?", "Remember my project preferences"],
-            ),
-        ]
+        # Create agent card from the static skills, pointing at the public URL
+        agent_card = _build_agent_card(NGROK_URL if NGROK_URL is not None else "")
         
-        # Create agent card - following the sample patterns
-        agent_card = AgentCard(
-            name="ZORA Assistant",
-            description="ZORA is a comprehensive AI assistant with voice interaction, persistent memory, and real-world integrations including web search, document processing, task management, calendar, and email.",
-            url=NGROK_URL if NGROK_URL is not None else "",
-            version="1.0.0",
-            default_input_modes=["text/plain"],
-            default_output_modes=["text/plain"],
-            capabilities=capabilities,
-            skills=skills,
-        )
-
         # Create ADK agent with configured user for A2A requests
         adk_agent = create_agent(user_id=user_id, model_id="gemini-2.0-flash")  # type: ignore
         
-        # Initialize memory service
-        try:
-            memory_service = ZepMemoryService()
-            logger.info("✅ ZepMemoryService initialized for A2A server")
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to initialize ZepMemoryService for A2A server: {e}")
+        # Initialize memory service - the Zep client itself is only created
+        # once the first A2A request adds or searches memory
+        if os.getenv("ZEP_API_KEY"):
+            memory_service = LazyZepMemoryService()
+            logger.info("✅ ZepMemoryService configured for A2A server")
+        else:
+            logger.warning("⚠️ Failed to initialize ZepMemoryService for A2A server: ZEP_API_KEY is not set")
             memory_service = None
         
         # Create runner
@@ -135,69 +217,51 @@ def create_a2a_server(host: str = "localhost", port: int = 10003, user_id: Optio
             app_name=APP_NAME,
             agent=adk_agent,  # type: ignore
             artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
+            session_service=BoundedSessionService(),
             memory_service=memory_service,
         )
         
         # Create agent executor
         agent_executor = ZoraAgentExecutor(runner)
-        logger.info("✅ Created ZoraAgentExecutor")
 
         # Create task store - following the sample patterns
-        task_store = InMemoryTaskStore()
-        logger.info("✅ Created InMemoryTaskStore")
+        task_store = BoundedTaskStore()
 
         # Create request handler - following sample patterns (no queue_manager needed)
-        logger.info("🎯 Creating DefaultRequestHandler with detailed logging")
-        logger.info(f"   - agent_executor type: {type(agent_executor)}")
-        logger.info(f"   - task_store type: {type(task_store)}")
-        
-        # Use DefaultRequestHandler directly (no extra logging)
         request_handler = DefaultRequestHandler(
             agent_executor=agent_executor,
             task_store=task_store,
         )
-        logger.info("✅ Created DefaultRequestHandler")
-        
-        # Test if the request handler is properly configured
-        logger.info(f"   - handler.agent_executor: {hasattr(request_handler, 'agent_executor')}")
-        logger.info(f"   - handler.task_store: {hasattr(request_handler, 'task_store')}")
+        logger.debug("   - agent_executor type: %s", type(agent_executor))
+        logger.debug("   - task_store type: %s", type(task_store))
 
         # Create A2A application - following sample patterns
-        logger.info("🎯 Creating A2AStarletteApplication")
         server = A2AStarletteApplication(
             agent_card=agent_card,
             http_handler=request_handler,
         )
         
-        # Add detailed request logging middleware
-        class DetailedLoggingMiddleware(BaseHTTPMiddleware):
-            async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
-                start_time = time.time()
-                logger.info(f"📥 Incoming {request.method} request to {request.url.path}")
-                logger.info(f"   - URL: {request.url}")
-                logger.info(f"   - Headers: {dict(request.headers)}")
-                # Log JSON body for POST requests
-                if request.method == "POST":
-                    try:
-                        body = await request.json()
-                        logger.info(f"   - Body JSON: {body}")
-                    except Exception:
-                        logger.info("   - Body JSON: <could not parse>")
-                # Proceed to next handler
-                response = await call_next(request)
-                process_time = time.time() - start_time
-                logger.info(f"📤 Completed {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.3f}s")
-                return response
-
         starlette_app = server.build()
+        # Serve the pre-encoded card ahead of the SDK's own agent card route
+        starlette_app.router.routes.insert(
+            0, Route(_AGENT_CARD_PATH, StaticAgentCardApp(agent_card), methods=["GET"])
+        )
         starlette_app.add_middleware(DetailedLoggingMiddleware)
+        starlette_app.add_event_handler("startup", use_eager_tasks)
         
-        logger.info("✅ A2AStarletteApplication created successfully with logging middleware")
-        
-        logger.info(f"✅ A2A server created successfully for ZORA on {host}:{port}")
+        logger.info("✅ A2A server created successfully for ZORA on %s:%s", host, port)
         return starlette_app
         
     except Exception as e:
-        logger.error(f"💥 Failed to create A2A server: {e}")
+        logger.error("💥 Failed to create A2A server: %s", e)
         raise
+
+
+def create_default_a2a_server() -> Optional[Starlette]:
+    """
+    Creates the A2A server from configuration.
+    
+    Used as the uvicorn application factory when the A2A server runs in its
+    own worker processes.
+    """
+    return create_a2a_server(host=A2A_HOST, port=A2A_PORT, user_id=A2A_SERVER_DEFAULT_USER)
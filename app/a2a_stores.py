@@ -0,0 +1,157 @@
+"""
+Size-bounded in-memory stores for the A2A server.
+Completed tasks and idle sessions are evicted so a long-running server doesn't grow without bound.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from a2a.server.tasks import InMemoryTaskStore
+from a2a.types import Task, TaskState
+from google.adk.sessions import InMemorySessionService, Session
+
+from .config import (
+    A2A_SESSION_STORE_MAX,
+    A2A_SESSION_TTL_SECONDS,
+    A2A_STORE_SWEEP_INTERVAL,
+    A2A_TASK_STORE_MAX,
+    A2A_TASK_TTL_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Tasks in these states will not be updated again and are safe to expire
+_TERMINAL_TASK_STATES = frozenset({
+    TaskState.completed,
+    TaskState.canceled,
+    TaskState.failed,
+    TaskState.rejected,
+})
+
+
+class BoundedTaskStore(InMemoryTaskStore):
+    """
+    InMemoryTaskStore that evicts the least recently saved tasks past a size cap,
+    preferring tasks in a terminal state, and periodically drops terminal tasks
+    older than a TTL.
+    """
+
+    def __init__(self, max_tasks: int = A2A_TASK_STORE_MAX, ttl_seconds: float = A2A_TASK_TTL_SECONDS):
+        super().__init__()
+        self.max_tasks = max_tasks
+        self.ttl_seconds = ttl_seconds
+        # task_id -> (last saved monotonic time, whether the task reached a terminal state)
+        self._recent: OrderedDict[str, Tuple[float, bool]] = OrderedDict()
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    async def save(self, task: Task, *args: Any, **kwargs: Any) -> None:
+        await super().save(task, *args, **kwargs)
+        self._recent[task.id] = (time.monotonic(), task.status.state in _TERMINAL_TASK_STATES)
+        self._recent.move_to_end(task.id)
+
+        while len(self._recent) > self.max_tasks:
+            task_id = self._eviction_candidate()
+            del self._recent[task_id]
+            await super().delete(task_id, *args, **kwargs)
+
+        self._ensure_sweeper()
+
+    def _eviction_candidate(self) -> str:
+        """The least recently saved terminal task, or the least recently saved task if none is terminal."""
+        for task_id, (_, terminal) in self._recent.items():
+            if terminal:
+                return task_id
+        # Every task is still live - a client polling or resuming it will lose it
+        task_id = next(iter(self._recent))
+        logger.warning("⚠️ A2A task store is full of live tasks, evicting task %s", task_id)
+        return task_id
+
+    async def delete(self, task_id: str, *args: Any, **kwargs: Any) -> None:
+        self._recent.pop(task_id, None)
+        await super().delete(task_id, *args, **kwargs)
+
+    async def sweep(self) -> None:
+        """Drop terminal tasks that haven't been saved within the TTL."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [
+            task_id
+            for task_id, (saved_at, terminal) in self._recent.items()
+            if terminal and saved_at < cutoff
+        ]
+        for task_id in expired:
+            await self.delete(task_id)
+        if expired:
+            logger.debug("Expired %d A2A tasks, %d remaining", len(expired), len(self._recent))
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(
+                _sweep_periodically(self.sweep), name="a2a-task-store-sweep"
+            )
+
+
+class BoundedSessionService(InMemorySessionService):
+    """
+    InMemorySessionService that evicts the least recently used sessions past a
+    size cap and periodically drops sessions idle for longer than a TTL.
+    """
+
+    def __init__(self, max_sessions: int = A2A_SESSION_STORE_MAX, ttl_seconds: float = A2A_SESSION_TTL_SECONDS):
+        super().__init__()
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        # (app_name, user_id, session_id) -> last used monotonic time
+        self._recent: OrderedDict[Tuple[str, str, str], float] = OrderedDict()
+        self._sweep_task: Optional[asyncio.Task] = None
+
+    async def create_session(self, *, app_name: str, user_id: str, **kwargs: Any) -> Session:
+        session = await super().create_session(app_name=app_name, user_id=user_id, **kwargs)
+        await self._touch((app_name, user_id, session.id))
+        return session
+
+    async def get_session(self, *, app_name: str, user_id: str, session_id: str, **kwargs: Any) -> Optional[Session]:
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, **kwargs
+        )
+        if session is not None:
+            await self._touch((app_name, user_id, session_id))
+        return session
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        self._recent.pop((app_name, user_id, session_id), None)
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+    async def sweep(self) -> None:
+        """Drop sessions that haven't been used within the TTL."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        expired = [key for key, used_at in self._recent.items() if used_at < cutoff]
+        for app_name, user_id, session_id in expired:
+            await self.delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        if expired:
+            logger.debug("Expired %d A2A sessions, %d remaining", len(expired), len(self._recent))
+
+    async def _touch(self, key: Tuple[str, str, str]) -> None:
+        self._recent[key] = time.monotonic()
+        self._recent.move_to_end(key)
+
+        while len(self._recent) > self.max_sessions:
+            (app_name, user_id, session_id), _ = self._recent.popitem(last=False)
+            await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(
+                _sweep_periodically(self.sweep), name="a2a-session-sweep"
+            )
+
+
+async def _sweep_periodically(sweep) -> None:
+    """Run a store's sweep every A2A_STORE_SWEEP_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(A2A_STORE_SWEEP_INTERVAL)
+        try:
+            await sweep()
+        except Exception as e:
+            logger.warning("⚠️ A2A store sweep failed: %s", e)
@@ -1,54 +1,105 @@
 from google.adk.agents import Agent
-from google.adk.tools import google_search, load_memory
-from google.adk.tools.agent_tool import AgentTool
-from .tools import process_document_tool, register_uploaded_files_tool, list_available_user_files_tool
-from .tools.a2a_tools import list_available_agents, send_message_to_agent, get_agent_capabilities, discover_new_agents
-from .prompt import PRIMARY_ASSISTANT_PROMPT
-from .sub_agents import create_calendar_agent, create_task_management_agent, create_gmail_agent
-from datetime import datetime
+from google.adk.tools import load_memory
+from .tools import process_document_tool, register_uploaded_files_tool, refresh_and_list_user_files_tool
+from .prompt import PRIMARY_ASSISTANT_PROMPT_TEMPLATE
+from .sub_agents import get_calendar_tool, get_task_tool, get_gmail_tool, invalidate_user_tools, on_user_tools_dropped
+from .utils.time_context import current_time_text
+from ..credentials import invalidate_user_env
 
 
-from typing import Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
 
+from google.adk.agents.readonly_context import ReadonlyContext
 
-def create_agent(user_id: Optional[str] = None, model_id: str = "gemini-2.0-flash") -> Agent:
-    """Create agent with dynamic datetime in the instruction and user-specific sub-agents"""
-    current_time = datetime.now().strftime("%A, %B %d, %Y at %I:%M %p")
-    
-    # Combine base prompt with current time context
-    dynamic_prompt = f"""Current Date and Time: {current_time}
 
-{PRIMARY_ASSISTANT_PROMPT}
+# (current time text, rendered instruction) - reused by every request within the same minute
+_instruction_cache: Tuple[str, str] = ("", "")
+
 
-Important: Always use the current date and time information provided above for context when handling time-sensitive requests, scheduling, or understanding relative time references."""
+def _build_instruction(context: ReadonlyContext) -> str:
+    """Render the instruction with the time of the request, not the time the agent was built."""
+    global _instruction_cache
     
-    # Create AgentTools for sub-agents with user-specific configuration
-    calendar_agent = create_calendar_agent(user_id=user_id)
-    calendar_tool = AgentTool(agent=calendar_agent)
+    current_time = current_time_text()
+    if current_time != _instruction_cache[0]:
+        _instruction_cache = (current_time, PRIMARY_ASSISTANT_PROMPT_TEMPLATE.format(current_time=current_time))
+    return _instruction_cache[1]
+
+
+# Tools shared by every user's agent
+_BASE_TOOLS = (
+    load_memory,
+    process_document_tool,
+    register_uploaded_files_tool,
+    refresh_and_list_user_files_tool,
+)
+
+
+# Built agents are reused per user, since only the instruction changes over
+# time and that is rendered per request. Ordered from least to most recently used.
+_AGENT_CACHE_SIZE = 128
+_agent_cache: OrderedDict[Tuple[Optional[str], str], Agent] = OrderedDict()
+
+
+def _drop_cached_agents(user_id: Optional[str]) -> None:
+    for key in [key for key in _agent_cache if key[0] == user_id]:
+        del _agent_cache[key]
+
+
+# A cached agent must not outlive the sub-agent tools (and MCP servers) it was built with
+on_user_tools_dropped(_drop_cached_agents)
+
+
+def invalidate_user(user_id: Optional[str]) -> None:
+    """Drop a user's cached agents and credentials environment, e.g. after their credentials change."""
+    invalidate_user_env(user_id)
+    invalidate_user_tools(user_id)
+    _drop_cached_agents(user_id)
+
+
+@lru_cache(maxsize=None)
+def _get_a2a_tools() -> Tuple[Callable, ...]:
+    """Import the A2A client tools on first use, so the A2A SDK loads only once an agent is built."""
+    from .tools.a2a_tools import (
+        discover_and_describe_agents,
+        list_available_agents,
+        send_message_to_agent,
+        get_agent_capabilities,
+        discover_new_agents,
+    )
     
-    task_management_agent = create_task_management_agent(user_id=user_id)  
-    task_management_tool = AgentTool(agent=task_management_agent)
+    return discover_and_describe_agents, list_available_agents, send_message_to_agent, get_agent_capabilities, discover_new_agents
+
+
+def create_agent(user_id: Optional[str] = None, model_id: str = "gemini-2.0-flash") -> Agent:
+    """Create agent with a per-request datetime in the instruction and user-specific sub-agents"""
+    agent = _agent_cache.get((user_id, model_id))
+    if agent is not None:
+        _agent_cache.move_to_end((user_id, model_id))
+        return agent
     
-    gmail_agent = create_gmail_agent(user_id=user_id)
-    gmail_tool = AgentTool(agent=gmail_agent)
+    # Get AgentTools for sub-agents with user-specific configuration
+    calendar_tool = get_calendar_tool(user_id)
+    task_management_tool = get_task_tool(user_id)
+    gmail_tool = get_gmail_tool(user_id)
     
-    return Agent(
+    agent = Agent(
         name="assistant",
         model=model_id,
         description="Agent to help with online search, document processing, image analysis, and remembering past conversations.",
-        instruction=dynamic_prompt,
+        instruction=_build_instruction,
         tools=[
-            load_memory,
-            process_document_tool,
-            register_uploaded_files_tool,
-            list_available_user_files_tool,
+            *_BASE_TOOLS,
             calendar_tool,
             task_management_tool,
             gmail_tool,
             # A2A client tools for communicating with other agents
-            list_available_agents,
-            send_message_to_agent,
-            get_agent_capabilities,
-            discover_new_agents,
+            *_get_a2a_tools(),
         ],
     )
+    _agent_cache[(user_id, model_id)] = agent
+    while len(_agent_cache) > _AGENT_CACHE_SIZE:
+        _agent_cache.popitem(last=False)
+    return agent
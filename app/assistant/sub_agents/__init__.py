@@ -10,14 +10,187 @@ Each sub-agent is designed to handle specific workflows while maintaining
 the same high-quality interaction patterns as the main assistant.
 """
 
-from .calendar_agent import create_calendar_agent, CALENDAR_PROMPT
-from .task_management_agent import create_task_management_agent, TASK_MANAGEMENT_PROMPT
-from .gmail_agent import create_gmail_agent
+import asyncio
+import importlib
+import logging
+import sys
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from google.adk.tools.agent_tool import AgentTool
+from google.adk.tools.base_toolset import BaseToolset
+
+logger = logging.getLogger(__name__)
+
+
+def _lazy_exports(module_name: str, exports: Dict[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module-level __getattr__ (PEP 562) that imports each exported name
+    from its module, given relative to `module_name`, on first access.
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(target, module_name), name)
+        # Cache on the module so later lookups skip __getattr__
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
+# Sub-agent modules pull in the MCP client stack, so they are only imported
+# on first access rather than when this package is imported
+__getattr__ = _lazy_exports(__name__, {
+    "create_calendar_agent": ".calendar_agent",
+    "CALENDAR_PROMPT": ".calendar_agent.prompt",
+    "create_task_management_agent": ".task_management_agent",
+    "TASK_MANAGEMENT_PROMPT": ".task_management_agent.prompt",
+    "create_gmail_agent": ".gmail_agent",
+})
+
+
+# AgentTool wrappers are built once per (sub-agent, user) and reused, so each
+# user's MCP server processes stay running across agent rebuilds. Ordered from
+# least to most recently used; dropped tools have their servers stopped.
+_TOOL_CACHE_SIZE = 384
+_tool_cache: OrderedDict[Tuple[str, Optional[str]], AgentTool] = OrderedDict()
+
+# Called with a user_id before that user's tools are dropped and their servers
+# stopped, so anything caching agents built from the tools can drop them too
+_tools_dropped_listeners: List[Callable[[Optional[str]], None]] = []
+
+
+# Background warmups and MCP server shutdowns, kept referenced so they aren't garbage collected
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _toolsets(tool: AgentTool) -> list:
+    return [toolset for toolset in tool.agent.tools if isinstance(toolset, BaseToolset)]
+
+
+def _close_tool(tool: AgentTool) -> None:
+    """Stop the MCP servers of a sub-agent tool that has been dropped from the cache."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # The servers' sessions belong to the loop that started them, so they can't be closed from here
+        logger.warning("⚠️ No running event loop - leaving MCP servers of %s running", tool.name)
+        return
+    for toolset in _toolsets(tool):
+        task = loop.create_task(toolset.close())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+def _get_tool(name: str, factory_name: str, user_id: Optional[str]) -> AgentTool:
+    key = (name, user_id)
+    tool = _tool_cache.get(key)
+    if tool is None:
+        create = globals().get(factory_name) or __getattr__(factory_name)
+        tool = AgentTool(agent=create(user_id=user_id))
+        _tool_cache[key] = tool
+        while len(_tool_cache) > _TOOL_CACHE_SIZE:
+            # Agents are built with all of a user's tools, so drop them together
+            invalidate_user_tools(next(iter(_tool_cache))[1])
+    _tool_cache.move_to_end(key)
+    return tool
+
+
+def get_calendar_tool(user_id: Optional[str] = None) -> AgentTool:
+    """Get the calendar agent wrapped as an AgentTool for a user."""
+    return _get_tool("calendar", "create_calendar_agent", user_id)
+
+
+def get_task_tool(user_id: Optional[str] = None) -> AgentTool:
+    """Get the task management agent wrapped as an AgentTool for a user."""
+    return _get_tool("task_management", "create_task_management_agent", user_id)
+
+
+def get_gmail_tool(user_id: Optional[str] = None) -> AgentTool:
+    """Get the Gmail agent wrapped as an AgentTool for a user."""
+    return _get_tool("gmail", "create_gmail_agent", user_id)
+
+
+def on_user_tools_dropped(listener: Callable[[Optional[str]], None]) -> None:
+    """Register a callback run with a user_id before that user's cached tools are dropped and closed."""
+    _tools_dropped_listeners.append(listener)
+
+
+def invalidate_user_tools(user_id: Optional[str]) -> None:
+    """Drop a user's cached sub-agent tools so they are rebuilt on next use."""
+    tools = [_tool_cache.pop(key) for key in [key for key in _tool_cache if key[1] == user_id]]
+    if not tools:
+        return
+    for listener in _tools_dropped_listeners:
+        listener(user_id)
+    for tool in tools:
+        _close_tool(tool)
+
+
+# Toolsets whose MCP server is already running, so repeated warmups skip them.
+# Weak references let rebuilt (invalidated) toolsets drop out on their own.
+_warmed_toolsets: "weakref.WeakSet[BaseToolset]" = weakref.WeakSet()
+
+async def warmup(user_ids: Iterable[Optional[str]]) -> None:
+    """
+    Build each user's sub-agent tools and open their MCP server connections
+    ahead of time, so the first real request only sees steady-state latency.
+    
+    All servers are started concurrently, so the wait is that of the slowest
+    server rather than the sum of all of them.
+    """
+    toolsets = [
+        toolset
+        for user_id in user_ids
+        for tool in (get_calendar_tool(user_id), get_task_tool(user_id), get_gmail_tool(user_id))
+        for toolset in _toolsets(tool)
+        if toolset not in _warmed_toolsets
+    ]
+    if not toolsets:
+        return
+    
+    logger.info("🔥 Warming up %d MCP toolsets...", len(toolsets))
+    results = await asyncio.gather(*(toolset.get_tools() for toolset in toolsets), return_exceptions=True)
+    failures = 0
+    for toolset, result in zip(toolsets, results):
+        if isinstance(result, BaseException):
+            failures += 1
+            logger.warning("⚠️ MCP toolset warmup failed: %s", result)
+        else:
+            _warmed_toolsets.add(toolset)
+    logger.info("✅ Warmed up %d/%d MCP toolsets", len(toolsets) - failures, len(toolsets))
+
+
+def warmup_in_background(user_id: Optional[str]) -> None:
+    """Start a user's MCP servers concurrently without waiting for them, e.g. when their session starts."""
+    task = asyncio.create_task(warmup([user_id]))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def shutdown() -> None:
+    """Stop every cached sub-agent's MCP servers, e.g. when the app shuts down."""
+    toolsets = [toolset for tool in _tool_cache.values() for toolset in _toolsets(tool)]
+    _tool_cache.clear()
+    await asyncio.gather(*(toolset.close() for toolset in toolsets), return_exceptions=True)
+
 
 __all__ = [
     "create_calendar_agent",
     "CALENDAR_PROMPT", 
     "create_task_management_agent",
     "TASK_MANAGEMENT_PROMPT",
-    "create_gmail_agent"
+    "create_gmail_agent",
+    "get_calendar_tool",
+    "get_task_tool",
+    "get_gmail_tool",
+    "invalidate_user_tools",
+    "on_user_tools_dropped",
+    "warmup",
+    "warmup_in_background",
+    "shutdown",
 ]
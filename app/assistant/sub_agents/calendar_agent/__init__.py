@@ -5,7 +5,13 @@ This module provides a specialized agent for managing Google Calendar events
 using the official Google Calendar MCP server by nspady.
 """
 
-from .agent import create_calendar_agent
-from .prompt import CALENDAR_PROMPT
+from .. import _lazy_exports
+
+# Imported on first access so that reading the prompt doesn't pull in the MCP client stack
+__getattr__ = _lazy_exports(__name__, {
+    "create_calendar_agent": ".agent",
+    "CALENDAR_PROMPT": ".prompt",
+})
+
 
 __all__ = ["create_calendar_agent", "CALENDAR_PROMPT"]
@@ -1,5 +1,11 @@
 """Gmail Agent module for email management functionality."""
 
-from .agent import create_gmail_agent
+from .. import _lazy_exports
+
+# Imported on first access so importing the package doesn't pull in the MCP client stack
+__getattr__ = _lazy_exports(__name__, {
+    "create_gmail_agent": ".agent",
+})
+
 
 __all__ = ["create_gmail_agent"]
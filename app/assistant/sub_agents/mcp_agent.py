@@ -0,0 +1,90 @@
+"""
+Shared construction for the MCP-backed sub-agents.
+
+Each sub-agent is an LLM agent whose tools come from a stdio MCP server run
+with npx, and whose instruction is its static prompt followed by the current time.
+"""
+
+import logging
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from google.adk.agents.llm_agent import Agent
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioConnectionParams, StdioServerParameters
+
+from ..utils.time_context import current_time_text
+from ...config import MCP_SERVER_LAUNCHER
+from ...credentials import get_user_env_for_agent
+from ...quiet_logging import quiet_third_party_logging
+
+quiet_third_party_logging()
+
+logger = logging.getLogger(__name__)
+
+SUB_AGENT_MODEL = "gemini-2.5-flash-lite"
+
+
+def get_env_for_user(user_id: Optional[str], service: str, label: str, required_var: str) -> Dict[str, str]:
+    """Get a sub-agent's MCP server environment variables for a specific user."""
+    if not user_id:
+        logger.warning("⚠️ No user_id provided - %s agent will have limited functionality", label)
+        return {}
+
+    # Use new credentials system
+    env = get_user_env_for_agent(user_id, service)
+
+    if not env.get(required_var):
+        logger.warning("⚠️ %s not set for user %s - %s agent will have limited functionality", required_var, user_id, label)
+
+    return env
+
+
+def timed_instruction(prompt: str, time_note: str) -> Callable[[ReadonlyContext], str]:
+    """
+    Build an instruction provider that renders `prompt` followed by the time of
+    the request (not the time the agent was built) and `time_note`. The
+    rendered text is reused by every request within the same minute.
+
+    The timestamp comes after the prompt so the long static prefix stays
+    identical across requests and can be served from the model's prompt cache.
+    """
+    # Everything up to the timestamp, built once
+    prefix = f"{prompt}\n\nCurrent Date and Time: "
+    # (current time text, rendered instruction)
+    cache: Tuple[str, str] = ("", "")
+
+    def build_instruction(context: ReadonlyContext) -> str:
+        nonlocal cache
+
+        current_time = current_time_text()
+        if current_time != cache[0]:
+            cache = (current_time, f"{prefix}{current_time}\n\n{time_note}")
+        return cache[1]
+
+    return build_instruction
+
+
+def build_mcp_agent(
+    name: str,
+    instruction: Callable[[ReadonlyContext], str],
+    npx_args: Sequence[str],
+    env: Dict[str, str],
+) -> Agent:
+    """Create a sub-agent backed by the MCP server started with `npx <npx_args>`."""
+    return Agent(
+        model=SUB_AGENT_MODEL,
+        name=name,
+        instruction=instruction,
+        tools=[
+            MCPToolset(
+                connection_params=StdioConnectionParams(
+                    server_params=StdioServerParameters(
+                        command=MCP_SERVER_LAUNCHER[0],
+                        args=[*MCP_SERVER_LAUNCHER[1:], *npx_args],
+                        env=env,
+                    ),
+                    timeout=60.0,
+                )
+            ),
+        ],
+    )
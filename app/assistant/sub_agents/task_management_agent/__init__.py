@@ -5,8 +5,14 @@ This module provides a specialized agent for managing tasks and projects
 using the official Todoist MCP server by abhiz123.
 """
 
-from .agent import create_task_management_agent
-from .prompt import TASK_MANAGEMENT_PROMPT
+from .. import _lazy_exports
+
+# Imported on first access so that reading the prompt doesn't pull in the MCP client stack
+__getattr__ = _lazy_exports(__name__, {
+    "create_task_management_agent": ".agent",
+    "TASK_MANAGEMENT_PROMPT": ".prompt",
+})
+
 
 __all__ = ["create_task_management_agent", "TASK_MANAGEMENT_PROMPT"]
 
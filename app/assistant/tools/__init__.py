@@ -7,11 +7,12 @@ document processing, file management, and other tasks.
 
 # Import all tools from submodules
 from .document_tools import process_document_tool
-from .file_tools import register_uploaded_files_tool, list_available_user_files_tool
+from .file_tools import register_uploaded_files_tool, list_available_user_files_tool, refresh_and_list_user_files_tool
 
 # Export all tools for easy importing
 __all__ = [
     'process_document_tool',
     'register_uploaded_files_tool', 
-    'list_available_user_files_tool'
+    'list_available_user_files_tool',
+    'refresh_and_list_user_files_tool'
 ]
@@ -3,17 +3,51 @@ A2A client tools for ZORA Assistant.
 These tools allow ZORA to communicate with other A2A agents.
 """
 
-import asyncio
 import logging
-from typing import List, Optional
+from typing import Any, List, Optional
 
+from a2a.types import AgentCard
 from google.adk.tools.tool_context import ToolContext
 
-from ...a2a_client import get_remote_agent_manager
+from ...a2a_client import get_remote_agent_manager, get_remote_agent_manager_nowait
 
 logger = logging.getLogger(__name__)
 
 
+def _format_agent_card(card: AgentCard) -> str:
+    """Format an agent card's description, capabilities and skills."""
+    # Format the agent information, one entry per line
+    lines = [
+        f"Agent: {card.name}",
+        f"Description: {card.description}",
+        f"URL: {card.url}",
+        f"Version: {card.version}",
+    ]
+
+    if card.capabilities:
+        lines.append(f"Capabilities: Streaming={card.capabilities.streaming}")
+
+    if card.skills:
+        lines.append("")
+        lines.append(f"Skills ({len(card.skills)}):")
+        for skill in card.skills:
+            lines.append(f"  • {skill.name}: {skill.description}")
+            if skill.examples:
+                lines.append(f"    Examples: {', '.join(skill.examples)}")
+
+    lines.append("")
+    return "\\n".join(lines)
+
+
+def _part_text(part: Any) -> str:
+    """Get the text of a response part, stringifying parts that aren't text."""
+    # The manager returns serialized parts, whose type is named "kind"
+    if type(part) is dict:
+        return part.get("text", "") if part.get("kind", part.get("type")) == "text" else str(part)
+    text = getattr(part, "text", None)
+    return str(text) if text is not None else str(part)
+
+
 async def list_available_agents(tool_context: ToolContext) -> str:
     """
     List all available A2A agents that ZORA can communicate with.
@@ -22,7 +56,7 @@ async def list_available_agents(tool_context: ToolContext) -> str:
         A formatted list of available agents with their descriptions and capabilities.
     """
     try:
-        manager = await get_remote_agent_manager()
+        manager = get_remote_agent_manager_nowait() or await get_remote_agent_manager()
         available_agents = manager.get_available_agents()
         
         if not available_agents:
@@ -52,7 +86,7 @@ async def send_message_to_agent(
         The response from the agent, or an error message if the request failed.
     """
     try:
-        manager = await get_remote_agent_manager()
+        manager = get_remote_agent_manager_nowait() or await get_remote_agent_manager()
         
         # Get conversation context from tool_context if available
         state = tool_context.state if tool_context else {}
@@ -71,14 +105,7 @@ async def send_message_to_agent(
             return f"No response received from {agent_name}."
         
         # Combine all text responses
-        response_text = ""
-        for part in response_parts:
-            if isinstance(part, dict) and part.get("type") == "text":
-                response_text += part.get("text", "") + "\\n"
-            elif hasattr(part, 'text'):
-                response_text += str(part.text) + "\\n"
-            else:
-                response_text += str(part) + "\\n"
+        response_text = "\\n".join(map(_part_text, response_parts))
         
         if not response_text.strip():
             return f"Received response from {agent_name} but it contained no text content."
@@ -105,31 +132,14 @@ async def get_agent_capabilities(agent_name: str, tool_context: ToolContext) ->
         Detailed information about the agent's capabilities and skills.
     """
     try:
-        manager = await get_remote_agent_manager()
+        manager = get_remote_agent_manager_nowait() or await get_remote_agent_manager()
         
-        if agent_name not in manager.agent_cards:
+        card = manager.agent_cards.get(agent_name)
+        if card is None:
             available_agents = ", ".join(manager.get_available_agents())
             return f"Agent '{agent_name}' not found. Available agents: {available_agents}"
         
-        card = manager.agent_cards[agent_name]
-        
-        # Format the agent information
-        info = f"Agent: {card.name}\\n"
-        info += f"Description: {card.description}\\n"
-        info += f"URL: {card.url}\\n"
-        info += f"Version: {card.version}\\n"
-        
-        if card.capabilities:
-            info += f"Capabilities: Streaming={card.capabilities.streaming}\\n"
-        
-        if card.skills:
-            info += f"\\nSkills ({len(card.skills)}):\\n"
-            for skill in card.skills:
-                info += f"  • {skill.name}: {skill.description}\\n"
-                if skill.examples:
-                    info += f"    Examples: {', '.join(skill.examples)}\\n"
-        
-        return info
+        return _format_agent_card(card)
         
     except Exception as e:
         logger.error(f"Error getting agent capabilities for {agent_name}: {e}")
@@ -147,22 +157,55 @@ async def discover_new_agents(agent_urls: List[str], tool_context: ToolContext)
         Status message about the discovery process.
     """
     try:
-        manager = await get_remote_agent_manager()
+        manager = get_remote_agent_manager_nowait() or await get_remote_agent_manager()
         
-        initial_count = len(manager.get_available_agents())
+        initial_count = len(manager.connections)
         
         logger.info(f"🔍 Discovering agents at {len(agent_urls)} URLs...")
         await manager.discover_and_connect_agents(agent_urls)
         
-        final_count = len(manager.get_available_agents())
+        final_count = len(manager.connections)
         new_agents = final_count - initial_count
         
         if new_agents > 0:
-            available_agents = manager.get_available_agents()
-            return f"✅ Successfully discovered {new_agents} new agents. Now connected to {final_count} total agents: {', '.join(available_agents)}"
+            return f"✅ Successfully discovered {new_agents} new agents. Now connected to {final_count} total agents: {', '.join(manager.connections)}"
         else:
             return f"No new agents found at the provided URLs. Still connected to {final_count} agents."
             
     except Exception as e:
         logger.error(f"Error discovering new agents: {e}")
         return f"Error discovering new agents: {str(e)}"
+
+
+async def discover_and_describe_agents(
+    tool_context: ToolContext,
+    agent_urls: Optional[List[str]] = None,
+) -> str:
+    """
+    List all available A2A agents together with their full capabilities in one step.
+    
+    Optionally connects to new agents at the given URLs first. Use this instead of
+    calling list_available_agents and get_agent_capabilities separately.
+    
+    Args:
+        agent_urls: Optional list of URLs where new A2A agents might be running
+        
+    Returns:
+        The capabilities and skills of every available agent.
+    """
+    try:
+        manager = get_remote_agent_manager_nowait() or await get_remote_agent_manager()
+        
+        if agent_urls:
+            logger.info(f"🔍 Discovering agents at {len(agent_urls)} URLs...")
+            await manager.discover_and_connect_agents(agent_urls)
+        
+        if not manager.agent_cards:
+            return "No A2A agents are currently available for communication."
+        
+        descriptions = "\\n".join(_format_agent_card(card) for card in manager.agent_cards.values())
+        return f"Available A2A agents ({len(manager.agent_cards)}):\\n\\n{descriptions}"
+        
+    except Exception as e:
+        logger.error(f"Error describing available agents: {e}")
+        return f"Error describing available agents: {str(e)}"
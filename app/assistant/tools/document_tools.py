@@ -5,24 +5,30 @@ This module provides unified document processing capabilities with improved
 error handling, type safety, and modular design.
 """
 
+import asyncio
 import os
-import tempfile
 import traceback
 from enum import Enum
-from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
 
 from google.adk.tools import FunctionTool
 from google.adk.tools.tool_context import ToolContext
 
 from ..utils.data_extractor import extract_universal_pdf_data, extract_docx_data
+from .tool_cache import cached_tool
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+def _discard(task: asyncio.Task) -> None:
+    """Cancel a speculative task whose result is no longer needed, without leaving its error unretrieved."""
+    task.cancel()
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+
 class DocumentType(Enum):
     """Supported document types"""
     PDF = "pdf"
@@ -81,25 +87,12 @@ class DocumentProcessor:
     
     def __init__(self, tool_context: ToolContext):
         self.tool_context = tool_context
-        self.temp_files: List[str] = []
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Cleanup temporary files"""
-        await self.cleanup()
-    
-    async def cleanup(self):
-        """Clean up any temporary files created during processing"""
-        for temp_file in self.temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-                    logger.debug(f"Cleaned up temporary file: {temp_file}")
-            except Exception as e:
-                logger.warning(f"Could not delete temp file {temp_file}: {e}")
-        self.temp_files.clear()
+        """Nothing to clean up - documents are parsed in memory or from their referenced files"""
     
     @staticmethod
     def detect_document_type(filename: str) -> Optional[DocumentType]:
@@ -132,21 +125,28 @@ class DocumentProcessor:
         """
         logger.debug(f"Searching for artifact: {filename}")
         
+        # The exact name is the common case, so start loading it while the
+        # artifacts are listed instead of after
+        exact_load = asyncio.create_task(self.tool_context.load_artifact(filename))
+        
         try:
             available_artifacts = await self.tool_context.list_artifacts()
             logger.debug(f"Available artifacts: {available_artifacts}")
         except Exception as e:
+            _discard(exact_load)
             logger.error(f"Error listing artifacts: {e}")
             return None, None
         
         # Try exact match first
         if filename in available_artifacts:
             try:
-                artifact = await self.tool_context.load_artifact(filename)
+                artifact = await exact_load
                 logger.debug(f"Found exact match: {filename}")
                 return artifact, filename
             except Exception as e:
                 logger.error(f"Error loading artifact '{filename}': {e}")
+        else:
+            _discard(exact_load)
         
         # Try partial matches
         matching_artifacts = [
@@ -166,12 +166,13 @@ class DocumentProcessor:
         logger.warning(f"No matching artifact found for: {filename}")
         return None, None
     
-    async def prepare_file_path(self, artifact: Any, artifact_name: str) -> Optional[str]:
+    def prepare_source(self, artifact: Any, artifact_name: str) -> Optional[Union[str, bytes]]:
         """
-        Prepare file path from artifact, handling both inline data and file references
+        Get the document to parse from an artifact: its inline data, parsed in
+        memory, or the path of the file it references
         
         Returns:
-            File path or None if preparation failed
+            Document bytes, file path, or None if the artifact has no usable data
         """
         if not artifact:
             logger.error(f"Artifact '{artifact_name}' is None")
@@ -179,35 +180,16 @@ class DocumentProcessor:
         
         # Handle inline data
         if hasattr(artifact, 'inline_data') and artifact.inline_data and artifact.inline_data.data:
-            try:
-                # Determine file extension for temp file
-                extension = Path(artifact_name).suffix or '.tmp'
-                
-                with tempfile.NamedTemporaryFile(suffix=extension, delete=False) as temp_file:
-                    temp_file.write(artifact.inline_data.data)
-                    temp_file_path = temp_file.name
-                
-                self.temp_files.append(temp_file_path)
-                logger.debug(f"Created temporary file: {temp_file_path}")
-                return temp_file_path
-                
-            except Exception as e:
-                logger.error(f"Error creating temporary file: {e}")
-                return None
+            return artifact.inline_data.data
         
         # Handle file path reference
-        elif hasattr(artifact, 'text') and artifact.text:
+        if hasattr(artifact, 'text') and artifact.text:
             file_path = artifact.text.strip()
             if os.path.exists(file_path):
                 logger.debug(f"Using file path reference: {file_path}")
                 return file_path
-            else:
-                logger.error(f"Referenced file does not exist: {file_path}")
-                return None
-        
-        # Handle direct content for text files
-        elif hasattr(artifact, 'text') and artifact.text:
-            return artifact.text  # Return content directly for text processing
+            logger.error(f"Referenced file does not exist: {file_path}")
+            return None
         
         logger.error(f"Artifact '{artifact_name}' contains no usable data")
         return None
@@ -224,14 +206,14 @@ class DocumentProcessor:
                 return result
             
             result.artifact_name = artifact_name
-            file_path = await self.prepare_file_path(artifact, artifact_name)
+            source = self.prepare_source(artifact, artifact_name)
             
-            if not file_path or not os.path.exists(file_path):
+            if not source:
                 result.set_error(f"Could not access PDF file: {filename}")
                 return result
             
             # Extract PDF data
-            pdf_data = extract_universal_pdf_data(file_path)
+            pdf_data = extract_universal_pdf_data(source)
             logger.info(f"Extracted {len(pdf_data)} pages from PDF")
             
             # Format content
@@ -275,14 +257,14 @@ class DocumentProcessor:
                 return result
             
             result.artifact_name = artifact_name
-            file_path = await self.prepare_file_path(artifact, artifact_name)
+            source = self.prepare_source(artifact, artifact_name)
             
-            if not file_path or not os.path.exists(file_path):
+            if not source:
                 result.set_error(f"Could not access DOCX file: {filename}")
                 return result
             
             # Extract DOCX data
-            docx_data = extract_docx_data(file_path)
+            docx_data = extract_docx_data(source)
             logger.info(f"Extracted DOCX content: {len(docx_data.get('text', ''))} chars, {len(docx_data.get('tables', []))} tables")
             
             # Format content
@@ -430,7 +412,13 @@ class DocumentProcessor:
             return {"error": error_msg}
 
 
+def _is_successful_result(result: Dict[str, Any]) -> bool:
+    """Only successful extractions are worth caching; errors may be transient."""
+    return "error" not in result and result.get("status") != "error"
+
+
 # Async function wrappers for the FunctionTool
+@cached_tool(ttl=1800, maxsize=64, should_cache=_is_successful_result)
 async def process_document_function(filename: str, tool_context: ToolContext) -> Dict[str, Any]:
     """
     Process any document (PDF, DOCX, TXT) with automatic format detection.
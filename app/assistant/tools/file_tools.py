@@ -2,6 +2,24 @@ from google.adk.tools import ToolContext
 from google.genai import types
 from pathlib import Path
 
+from cachetools import TTLCache
+
+from .tool_cache import cached_tool, invalidate_session, session_key
+
+# Folder the /upload endpoint saves user files to
+_UPLOADS_DIR = Path(__file__).parent.parent.parent / "uploads"
+
+# How long after a session registered uploads the combined refresh-and-list
+# tool skips re-scanning the uploads folder, unless new files arrive.
+# Sessions that registered within the interval are kept in a TTL cache.
+_REGISTER_INTERVAL = 10  # seconds
+_recently_registered: TTLCache = TTLCache(maxsize=1024, ttl=_REGISTER_INTERVAL)
+
+
+def mark_uploads_changed() -> None:
+    """Make the next refresh-and-list call in every session re-scan the uploads folder."""
+    _recently_registered.clear()
+
 
 async def register_uploaded_files(tool_context: ToolContext) -> dict:
     """
@@ -23,8 +41,7 @@ async def register_uploaded_files(tool_context: ToolContext) -> dict:
         - registered_files: List of file registration results
         - message: Status message if no files found
     """
-    # Get the uploads directory path
-    uploads_dir = Path(__file__).parent.parent.parent / "uploads"
+    uploads_dir = _UPLOADS_DIR
     
     if not uploads_dir.exists():
         return {"registered_files": [], "message": "No uploads directory found"}
@@ -87,9 +104,14 @@ async def register_uploaded_files(tool_context: ToolContext) -> dict:
         
         saved.append(entry)
     
+    # Newly registered files change what the listing and document tools return
+    if any(entry.get("status") == "registered" for entry in saved):
+        invalidate_session(tool_context)
+    
     return {"registered_files": saved}
 
 
+@cached_tool(ttl=60, should_cache=lambda result: not result.startswith("Error:"))
 async def list_available_user_files(tool_context: ToolContext) -> str:
     """
     List all available artifacts/files that can be processed.
@@ -98,8 +120,9 @@ async def list_available_user_files(tool_context: ToolContext) -> str:
     and registered as artifacts. This includes documents, images, and other files
     that are available for processing or analysis.
     
-    IMPORTANT: Always run register_uploaded_files_tool first to ensure the 
-    artifact list is up-to-date with any newly uploaded files.
+    The listing is cached per session for a minute, and refreshed as soon as
+    new files are registered. To pick up newly uploaded files as well, use
+    refresh_and_list_user_files_tool instead.
     
     Args:
         tool_context: The ToolContext for accessing artifacts.
@@ -123,6 +146,34 @@ async def list_available_user_files(tool_context: ToolContext) -> str:
         print(f"An unexpected error occurred during artifact list: {e}")
         return "Error: An unexpected error occurred while listing artifacts."
 
+
+async def refresh_and_list_user_files(tool_context: ToolContext) -> dict:
+    """
+    Register any newly uploaded files and list all available files in one step.
+    
+    Scans the uploads folder, registers new files as artifacts, and then returns
+    the list of every file available for processing or analysis. Use this whenever
+    the user mentions files, instead of registering and listing separately.
+    
+    Args:
+        tool_context: The ToolContext for saving and listing artifacts.
+        
+    Returns:
+        A dictionary containing:
+        - registered_files: List of file registration results (empty if the scan was skipped)
+        - available_files: Formatted list of all available files
+    """
+    key = session_key(tool_context)
+    registered = {"registered_files": []}
+    if key not in _recently_registered:
+        registered = await register_uploaded_files(tool_context)
+        _recently_registered[key] = True
+    
+    return {
+        "registered_files": registered["registered_files"],
+        "available_files": await list_available_user_files(tool_context=tool_context),
+    }
+
  
 # Wrap functions into FunctionTools
 from google.adk.tools import FunctionTool
@@ -133,3 +184,7 @@ register_uploaded_files_tool = FunctionTool(
 list_available_user_files_tool = FunctionTool(
     func=list_available_user_files
 )
+
+refresh_and_list_user_files_tool = FunctionTool(
+    func=refresh_and_list_user_files
+)
@@ -0,0 +1,82 @@
+"""
+Per-session result caching for read-only assistant tools.
+
+The assistant is prompted to re-list and re-process files often, so identical
+calls within a session are answered from a short-lived cache instead of
+re-reading artifacts.
+"""
+
+import copy
+import functools
+import inspect
+import json
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+
+from cachetools import TTLCache
+from google.adk.tools.tool_context import ToolContext
+
+logger = logging.getLogger(__name__)
+
+# Every cache created by cached_tool, so a session can be invalidated across all of them
+_caches: List[TTLCache] = []
+
+
+def session_key(tool_context: ToolContext) -> Tuple[str, str, str]:
+    """Identify the session a tool call belongs to."""
+    # ToolContext has no public session id; keying on the ADK session keeps the
+    # cache key out of the session state that gets persisted and copied to sub-agents
+    invocation_context = tool_context._invocation_context
+    return (invocation_context.app_name, invocation_context.user_id, invocation_context.session.id)
+
+
+def cached_tool(
+    ttl: float,
+    maxsize: int = 256,
+    should_cache: Optional[Callable[[Any], bool]] = None,
+) -> Callable:
+    """
+    Cache an async tool function's results per session and arguments for `ttl` seconds.
+
+    The wrapped function must take a `tool_context` argument. Results for which
+    `should_cache` returns False (e.g. errors) are returned but not stored.
+    Every call gets its own copy of a cached result, so callers can't alter the cache.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        _caches.append(cache)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            tool_context = bound.arguments.pop("tool_context")
+            key = (
+                session_key(tool_context),
+                json.dumps(bound.arguments, sort_keys=True, default=str),
+            )
+
+            try:
+                result = cache[key]
+                logger.debug("Tool cache hit for %s", func.__name__)
+                return copy.deepcopy(result)
+            except KeyError:
+                pass
+
+            result = await func(*args, **kwargs)
+            if should_cache is None or should_cache(result):
+                cache[key] = copy.deepcopy(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate_session(tool_context: ToolContext) -> None:
+    """Drop every cached tool result for the tool context's session, e.g. after new files are registered."""
+    session = session_key(tool_context)
+    for cache in _caches:
+        for key in [key for key in list(cache.keys()) if key[0] == session]:
+            cache.pop(key, None)
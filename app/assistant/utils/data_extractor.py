@@ -3,18 +3,18 @@ import pytesseract  # type: ignore
 import fitz  # type: ignore
 from PIL import Image
 import io
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 from docx import Document
 pytesseract.pytesseract.tesseract_cmd = r'/usr/local/bin/tesseract' # For macOS/Linux
 
 
-def extract_universal_pdf_data(pdf_path: str) -> List[Dict[str, Any]]:
+def extract_universal_pdf_data(pdf_source: Union[str, bytes]) -> List[Dict[str, Any]]:
     """
     Extracts text and tables from each page of a PDF, automatically using OCR
     for image-based pages.
 
     Args:
-        pdf_path: The file path to the PDF.
+        pdf_source: The file path to the PDF, or the PDF's contents.
 
     Returns:
         A list of dictionaries, where each dictionary represents a page
@@ -22,9 +22,15 @@ def extract_universal_pdf_data(pdf_path: str) -> List[Dict[str, Any]]:
     """
     all_page_data: List[Dict[str, Any]] = []
     # Use PyMuPDF to handle the rasterization for OCR
-    doc_for_ocr = fitz.open(pdf_path)
-
-    with pdfplumber.open(pdf_path) as pdf:
+    # In-memory contents are parsed directly instead of via a temporary file
+    if isinstance(pdf_source, bytes):
+        doc_for_ocr = fitz.open(stream=pdf_source, filetype="pdf")
+        pdf_file: Union[str, io.BytesIO] = io.BytesIO(pdf_source)
+    else:
+        doc_for_ocr = fitz.open(pdf_source)
+        pdf_file = pdf_source
+
+    with pdfplumber.open(pdf_file) as pdf:
         for i, page in enumerate(pdf.pages):
             page_data: Dict[str, Any] = {
                 "page_number": i + 1,
@@ -63,17 +69,17 @@ def extract_universal_pdf_data(pdf_path: str) -> List[Dict[str, Any]]:
 
 
 
-def extract_docx_data(docx_path: str) -> Dict[str, Any]:
+def extract_docx_data(docx_source: Union[str, bytes]) -> Dict[str, Any]:
     """
     Extracts all text and tables from a .docx file.
 
     Args:
-        docx_path: The file path to the .docx document.
+        docx_source: The file path to the .docx document, or the document's contents.
 
     Returns:
         A dictionary containing the full text and a list of all tables.
     """
-    doc = Document(docx_path)
+    doc = Document(io.BytesIO(docx_source) if isinstance(docx_source, bytes) else docx_source)
     full_text = []
     
     # Extract text from paragraphs
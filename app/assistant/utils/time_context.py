@@ -0,0 +1,35 @@
+"""
+Current date and time text for agent instructions.
+The text only has minute resolution, so it is formatted once per minute and reused.
+"""
+
+import time
+from datetime import datetime
+
+_WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+# (minute since the epoch, formatted text) of the last call
+_time_cache: tuple[int, str] = (-1, "")
+
+
+def _format(now: datetime) -> str:
+    """Same as strftime("%A, %B %d, %Y at %I:%M %p") in the C locale, without the locale-aware formatting."""
+    return (
+        f"{_WEEKDAYS[now.weekday()]}, {_MONTHS[now.month - 1]} {now.day:02d}, {now.year} "
+        f"at {(now.hour - 1) % 12 + 1:02d}:{now.minute:02d} {'AM' if now.hour < 12 else 'PM'}"
+    )
+
+
+def current_time_text() -> str:
+    """Return the current local date and time, e.g. 'Monday, January 01, 2024 at 09:30 AM'."""
+    global _time_cache
+
+    now = time.time()
+    minute = int(now) // 60
+    if minute != _time_cache[0]:
+        _time_cache = (minute, _format(datetime.fromtimestamp(now)))
+    return _time_cache[1]
@@ -4,6 +4,7 @@ Based on the tutorial from adk_memory_zep.ipynb
 """
 
 import os
+from functools import cached_property
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any
 from typing_extensions import override
@@ -219,3 +220,27 @@ class ZepMemoryService(BaseMemoryService):
         except Exception as e:
             print(f"💥 Error searching Zep memory for user '{user_id}': {e}")
             return SearchMemoryResponse(memories=[])
+
+
+class LazyZepMemoryService(BaseMemoryService):
+    """
+    A ZepMemoryService that defers creating the Zep client until memory is
+    first added or searched, so an idle server never pays for it.
+    """
+
+    def __init__(self, zep_config: Optional[Dict[str, Any]] = None) -> None:
+        self._zep_config = zep_config
+
+    @cached_property
+    def service(self) -> ZepMemoryService:
+        return ZepMemoryService(self._zep_config)
+
+    @override
+    async def add_session_to_memory(self, session: Session) -> None:
+        await self.service.add_session_to_memory(session)
+
+    @override
+    async def search_memory(
+        self, *, app_name: str, user_id: str, query: str
+    ) -> SearchMemoryResponse:
+        return await self.service.search_memory(app_name=app_name, user_id=user_id, query=query)
@@ -20,12 +20,39 @@ USER_DATA_LOCATION = str(Path(__file__).parent.parent / "user_data")
 # Server Configuration
 DEFAULT_HOST = "0.0.0.0"
 DEFAULT_PORT = 8001
+# Worker processes for the FastAPI server; above 1, each server runs as its own uvicorn process.
+# Sessions, artifacts and the per-user agent, credential and MCP caches live in
+# each process's memory and are invalidated only in the process that handled the
+# change, so more than one worker is opt-in until they are shared across processes
+FASTAPI_WORKERS = max(1, int(os.getenv("FASTAPI_WORKERS", "1")))
+# Run new asyncio tasks eagerly (Python 3.12+), so tasks that finish without
+# suspending skip a round trip through the event loop
+ASYNCIO_EAGER_TASKS = os.getenv("ASYNCIO_EAGER_TASKS", "true").lower() == "true"
 
 # A2A Server Configuration
 ACTIVATE_A2A_SERVER = True
 A2A_HOST = "0.0.0.0"  # Bind to all interfaces for ngrok
 A2A_PORT = 80  # Use port 80 for ngrok
 A2A_SERVER_DEFAULT_USER = "test"
+# A2A sessions and tasks live in in-memory stores, so follow-up requests for
+# the same context must reach the same process - keep a single worker
+A2A_WORKERS = 1
+
+# Users whose MCP sub-agent connections are opened when the FastAPI server starts,
+# so their first request doesn't pay the MCP server startup (comma-separated)
+MCP_WARMUP_USERS: List[str] = [
+    user_id.strip().lower() for user_id in os.getenv("MCP_WARMUP_USERS", "").split(",") if user_id.strip()
+]
+
+# npm packages of the MCP servers behind the sub-agents, and the command that runs them
+MCP_SERVER_LAUNCHER = ("uv", "run", "npx")
+CALENDAR_MCP_PACKAGE = "@nihaal084/google-calendar-mcp"
+GMAIL_MCP_PACKAGE = "@gongrzhe/server-gmail-autoauth-mcp"
+TODOIST_MCP_PACKAGE = "@nihaal084/todoist-mcp-server"
+# Download the MCP server packages into the npx cache when `python -m app`
+# starts, so the first sub-agent call doesn't wait on npm
+MCP_PREFETCH_PACKAGES = os.getenv("MCP_PREFETCH_PACKAGES", "true").lower() == "true"
+MCP_PREFETCH_TIMEOUT = 180  # seconds
 
 # Ngrok Configuration
 USE_NGROK_FOR_A2A = True  # Set to True to automatically start ngrok for A2A server
@@ -48,4 +75,20 @@ A2A_AGENT_URLS: List[Optional[str]] = [
 # A2A Discovery and Connection Settings
 A2A_DISCOVERY_ENABLED = True
 A2A_CONNECTION_TIMEOUT = 30  # seconds
-A2A_RETRY_ATTEMPTS = 3
+A2A_RETRY_ATTEMPTS = max(1, int(os.getenv("A2A_RETRY_ATTEMPTS", "3")))  # discovery always makes at least one attempt
+A2A_DISCOVERY_CONCURRENCY = 6  # agent card requests in flight at once during discovery
+A2A_DISCOVERY_TIMEOUT = float(os.getenv("A2A_DISCOVERY_TIMEOUT", "5"))  # seconds per agent card request during discovery
+A2A_MAX_AGENTS = int(os.getenv("A2A_MAX_AGENTS", "64"))  # least recently used agents are evicted past this
+A2A_HEALTH_CHECK_INTERVAL = float(os.getenv("A2A_HEALTH_CHECK_INTERVAL", "300"))  # seconds
+A2A_HEALTH_CHECK_TIMEOUT = 5  # seconds
+A2A_HEALTH_CHECK_FAILURES = 3  # consecutive failed checks before an agent is evicted
+
+# Window (seconds) for coalescing intermediate A2A task status updates
+A2A_STATUS_COALESCE_WINDOW = float(os.getenv("A2A_STATUS_COALESCE_WINDOW", "0.05"))
+
+# Size caps and TTLs for the A2A server's in-memory task and session stores
+A2A_TASK_STORE_MAX = int(os.getenv("A2A_TASK_STORE_MAX", "1024"))
+A2A_TASK_TTL_SECONDS = float(os.getenv("A2A_TASK_TTL_SECONDS", "3600"))
+A2A_SESSION_STORE_MAX = int(os.getenv("A2A_SESSION_STORE_MAX", "1024"))
+A2A_SESSION_TTL_SECONDS = float(os.getenv("A2A_SESSION_TTL_SECONDS", "3600"))
+A2A_STORE_SWEEP_INTERVAL = float(os.getenv("A2A_STORE_SWEEP_INTERVAL", "300"))  # seconds
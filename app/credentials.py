@@ -6,29 +6,36 @@ Replaces the user-specific env file functionality
 import os
 import subprocess
 import shutil
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 from pathlib import Path
 import logging
 
 from .database import get_database
-from .config import USER_DATA_LOCATION
+from .config import CALENDAR_MCP_PACKAGE, GMAIL_MCP_PACKAGE, USER_DATA_LOCATION
 
 logger = logging.getLogger(__name__)
 
+# User data locations, resolved once at import time
+_USER_DATA_PATH = Path(USER_DATA_LOCATION)
+_GMAIL_CREDENTIALS_DIR = _USER_DATA_PATH / "gmail_credentials"
+_CALENDAR_CREDENTIALS_DIR = _USER_DATA_PATH / "calendar_credentials"
+
+# Agent environments per (user_id, service), so rebuilding a user's sub-agents
+# doesn't query the database again. Cleared by invalidate_user_env when credentials change.
+_env_cache: Dict[Tuple[str, str], Dict[str, str]] = {}
+
 
 def ensure_user_data_directories():
     """Ensure all necessary user data directories exist"""
-    user_data_path = Path(USER_DATA_LOCATION)
-    
     # Create main user_data directory
-    user_data_path.mkdir(parents=True, exist_ok=True)
+    _USER_DATA_PATH.mkdir(parents=True, exist_ok=True)
     
     # Create subdirectories for different credential types
     subdirs = ["credentials", "gmail_credentials", "calendar_credentials"]
     for subdir in subdirs:
-        (user_data_path / subdir).mkdir(parents=True, exist_ok=True)
+        (_USER_DATA_PATH / subdir).mkdir(parents=True, exist_ok=True)
     
-    logger.info("User data directories ensured at: %s", user_data_path)
+    logger.info("User data directories ensured at: %s", _USER_DATA_PATH)
 
 
 class DatabaseCredentialsManager:
@@ -134,7 +141,7 @@ class DatabaseCredentialsManager:
             
             # Run Gmail authentication
             auth_process = subprocess.run(
-                ["npx", "@gongrzhe/server-gmail-autoauth-mcp", "auth"],
+                ["npx", GMAIL_MCP_PACKAGE, "auth"],
                 cwd=str(gmail_mcp_dir),
                 capture_output=True,
                 text=True,
@@ -161,8 +168,7 @@ class DatabaseCredentialsManager:
                 }
             
             # Create user-specific gmail_credentials directory
-            user_data_path = Path(USER_DATA_LOCATION)
-            gmail_credentials_dir = user_data_path / "gmail_credentials"
+            gmail_credentials_dir = _GMAIL_CREDENTIALS_DIR
             gmail_credentials_dir.mkdir(parents=True, exist_ok=True)
             print(f"📁 Gmail credentials directory: {gmail_credentials_dir}")
             
@@ -235,8 +241,7 @@ class DatabaseCredentialsManager:
             print(f"🔑 Using OAuth credentials for Calendar: {oauth_credentials}")
             
             # Create user-specific calendar_credentials directory
-            user_data_path = Path(USER_DATA_LOCATION)
-            calendar_credentials_dir = user_data_path / "calendar_credentials"
+            calendar_credentials_dir = _CALENDAR_CREDENTIALS_DIR
             calendar_credentials_dir.mkdir(parents=True, exist_ok=True)
             print(f"📁 Calendar credentials directory: {calendar_credentials_dir}")
             
@@ -262,7 +267,7 @@ class DatabaseCredentialsManager:
             
             # Run Calendar authentication using published MCP server
             auth_process = subprocess.run(
-                ["uv", "run", "npx", "-y", "@nihaal084/google-calendar-mcp", "auth"],
+                ["uv", "run", "npx", "-y", CALENDAR_MCP_PACKAGE, "auth"],
                 cwd=str(Path(__file__).parent.parent),
                 capture_output=True,
                 text=True,
@@ -363,6 +368,11 @@ def get_user_env_for_agent(user_id: Optional[str], service: str) -> Dict[str, st
         logger.warning("No user_id provided for %s service", service)
         return {}
 
+    cache_key = (user_id.lower().strip(), service)
+    cached_env = _env_cache.get(cache_key)
+    if cached_env is not None:
+        return dict(cached_env)
+
     credentials_manager = DatabaseCredentialsManager(user_id)
     env_vars: Dict[str, str] = {}
     
@@ -393,4 +403,14 @@ def get_user_env_for_agent(user_id: Optional[str], service: str) -> Dict[str, st
     if not env_vars:
         logger.warning("No credentials found for user %s and service %s", user_id, service)
     
-    return env_vars
\ No newline at end of file
+    _env_cache[cache_key] = env_vars
+    return dict(env_vars)
+
+
+def invalidate_user_env(user_id: Optional[str]) -> None:
+    """Drop a user's cached agent environments, e.g. after their credentials change."""
+    if not user_id:
+        return
+    user_id = user_id.lower().strip()
+    for key in [key for key in _env_cache if key[0] == user_id]:
+        del _env_cache[key]
\ No newline at end of file
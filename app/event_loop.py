@@ -0,0 +1,17 @@
+"""
+Event loop tuning shared by the FastAPI and A2A servers.
+"""
+
+import asyncio
+
+from .config import ASYNCIO_EAGER_TASKS
+
+
+def use_eager_tasks() -> None:
+    """
+    Make the running loop start new tasks eagerly, so a task that completes
+    without suspending never waits for a loop iteration. Needs Python 3.12+.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if ASYNCIO_EAGER_TASKS and factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
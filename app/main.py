@@ -3,7 +3,6 @@ import base64
 import json
 import logging
 import os
-import warnings
 import uuid
 import shutil
 from pathlib import Path
@@ -11,24 +10,17 @@ from typing import AsyncIterable, Dict
 
 from dotenv import load_dotenv
 
-# Suppress various warnings
-warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
-warnings.filterwarnings("ignore", message=".*BaseAuthenticatedTool.*experimental.*")
-warnings.filterwarnings("ignore", message=".*auth_config.*auth_scheme.*missing.*")
+from .quiet_logging import quiet_third_party_logging
 
-# Configure logging to reduce MCP tool verbosity
-logging.getLogger("google.adk.tools.mcp_tool").setLevel(logging.ERROR)
-# Suppress MCP-related asyncio errors during shutdown
-logging.getLogger("mcp").setLevel(logging.WARNING)
-logging.getLogger("mcp.client").setLevel(logging.WARNING)
-logging.getLogger("mcp.client.stdio").setLevel(logging.WARNING)
+# Suppress noisy warnings and MCP tool logging before the ADK is imported
+quiet_third_party_logging()
 
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 # logging.getLogger("google.adk").setLevel(logging.WARNING)
 
 from fastapi import FastAPI, Query, WebSocket, UploadFile, File, HTTPException, Request, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.websockets import WebSocketDisconnect
 from pydantic import BaseModel
@@ -40,12 +32,19 @@ from google.adk.runners import Runner
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.adk.artifacts import InMemoryArtifactService
 from google.genai import types
-from .assistant.agent import create_agent
+from .assistant.agent import create_agent, invalidate_user
+from .assistant.tools.file_tools import mark_uploads_changed
 from .assistant.utils.zep_memory_service import ZepMemoryService
 from .assistant.utils.session_memory_manager import SessionMemoryManager
-from .config import APP_NAME, DEFAULT_VOICE, USER_DATA_LOCATION
+from .assistant.sub_agents import (
+    shutdown as shutdown_sub_agents,
+    warmup as warmup_sub_agents,
+    warmup_in_background,
+)
+from .config import APP_NAME, DEFAULT_VOICE, MCP_WARMUP_USERS, USER_DATA_LOCATION
 from .database import get_database
 from .credentials import DatabaseCredentialsManager, ensure_user_data_directories
+from .event_loop import use_eager_tasks
 
 # Pydantic models
 class UserLoginRequest(BaseModel):
@@ -120,6 +119,8 @@ async def start_agent_session(session_id, user_id=None):
     try:
         # Create user-specific agent
         user_agent = create_agent(user_id=effective_user_id, model_id="gemini-live-2.5-flash-preview")
+        # Start the user's MCP sub-agent servers together instead of one by one on first use
+        warmup_in_background(effective_user_id)
 
         # Create a Session
         session = await session_service.create_session(
@@ -338,7 +339,26 @@ async def client_to_agent_messaging(
 # FastAPI web app
 #
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
+
+app.add_event_handler("startup", use_eager_tasks)
+
+# Background MCP warmup task, kept referenced so it isn't garbage collected
+mcp_warmup_task: Optional[asyncio.Task] = None
+
+
+@app.on_event("startup")
+async def start_mcp_warmup():
+    """Open configured users' MCP connections in the background without delaying startup."""
+    global mcp_warmup_task
+    if MCP_WARMUP_USERS:
+        mcp_warmup_task = asyncio.create_task(warmup_sub_agents(MCP_WARMUP_USERS))
+
+
+@app.on_event("shutdown")
+async def stop_mcp_servers():
+    """Stop the MCP sub-agent server processes along with the app."""
+    await shutdown_sub_agents()
 
 STATIC_DIR = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
@@ -595,6 +615,9 @@ async def update_user(request: UserUpdateRequest):
                 logger.error(f"Calendar authentication error for {user_id}: {e}")
                 auth_results.append(f"Calendar: Authentication failed - {str(e)}")
         
+        # Rebuild the user's agents with their new credentials on next use
+        invalidate_user(user_id)
+        
         response_data = {
             "success": True,
             "message": f"User {user_id} updated successfully"
@@ -636,6 +659,7 @@ async def setup_gmail_auth(request: Dict[str, str]):
         # Set up Gmail authentication
         credentials_manager = DatabaseCredentialsManager(user_id)
         result = credentials_manager.setup_gmail_authentication()
+        invalidate_user(user_id)
         
         return result
         
@@ -670,6 +694,7 @@ async def setup_calendar_auth(request: Dict[str, str]):
         # Set up Calendar authentication
         credentials_manager = DatabaseCredentialsManager(user_id)
         result = credentials_manager.setup_calendar_authentication()
+        invalidate_user(user_id)
         
         return result
         
@@ -755,6 +780,7 @@ async def upload_credentials(file: UploadFile = File(...), user_id: str = Form(.
             )
             if not success:
                 logger.warning(f"Failed to update credentials path for existing user {user_id}")
+            invalidate_user(user_id)
         
         return {
             "success": True,
@@ -780,6 +806,9 @@ async def upload_file(file: UploadFile = File(...)):
         with open(file_path, "wb") as buffer:
             shutil.copyfileobj(file.file, buffer)
         
+        # Let the assistant's file listing pick up the new upload right away
+        mark_uploads_changed()
+        
         # Return file information
         return {
             "filename": file.filename,
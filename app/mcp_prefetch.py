@@ -0,0 +1,52 @@
+"""
+Download the MCP sub-agents' server packages into the npx cache ahead of time,
+so the first sub-agent start skips the npm download.
+Run once by the process that starts the servers rather than by every worker.
+"""
+
+import asyncio
+import logging
+
+from .config import (
+    CALENDAR_MCP_PACKAGE,
+    GMAIL_MCP_PACKAGE,
+    MCP_PREFETCH_TIMEOUT,
+    MCP_SERVER_LAUNCHER,
+    TODOIST_MCP_PACKAGE,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _prefetch_package(package: str) -> None:
+    # Same launcher and npx cache entry as the real server, but runs
+    # `node --version` instead of the server so nothing is started
+    process = await asyncio.create_subprocess_exec(
+        *MCP_SERVER_LAUNCHER, "--yes", "--package", package, "--", "node", "--version",
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    try:
+        await asyncio.wait_for(process.wait(), timeout=MCP_PREFETCH_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise RuntimeError(f"timed out after {MCP_PREFETCH_TIMEOUT}s") from None
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    if process.returncode != 0:
+        raise RuntimeError(f"exited with code {process.returncode}")
+
+
+async def prefetch_packages() -> None:
+    """Install every MCP server package into the npx cache concurrently."""
+    packages = (CALENDAR_MCP_PACKAGE, GMAIL_MCP_PACKAGE, TODOIST_MCP_PACKAGE)
+    logger.info("📦 Prefetching %d MCP server packages...", len(packages))
+    results = await asyncio.gather(*(_prefetch_package(package) for package in packages), return_exceptions=True)
+    failures = 0
+    for package, result in zip(packages, results):
+        if isinstance(result, BaseException):
+            failures += 1
+            logger.warning("⚠️ MCP package prefetch failed for %s: %s", package, result)
+    logger.info("✅ Prefetched %d/%d MCP server packages", len(packages) - failures, len(packages))
@@ -0,0 +1,29 @@
+"""
+Suppress noisy third-party warnings and MCP log output.
+Shared by the web app and the sub-agent modules, and applied only once per process.
+"""
+
+import logging
+import warnings
+
+_configured = False
+
+
+def quiet_third_party_logging() -> None:
+    """Silence ADK/MCP warnings and reduce MCP tool log verbosity."""
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    # Suppress various warnings
+    warnings.filterwarnings("ignore", category=UserWarning, module="pydantic")
+    warnings.filterwarnings("ignore", message=".*BaseAuthenticatedTool.*experimental.*")
+    warnings.filterwarnings("ignore", message=".*auth_config.*auth_scheme.*missing.*")
+
+    # Reduce logging verbosity for MCP tools
+    logging.getLogger("google.adk.tools.mcp_tool").setLevel(logging.ERROR)
+    # Suppress MCP-related asyncio errors during shutdown
+    logging.getLogger("mcp").setLevel(logging.WARNING)
+    logging.getLogger("mcp.client").setLevel(logging.WARNING)
+    logging.getLogger("mcp.client.stdio").setLevel(logging.WARNING)
@@ -0,0 +1,108 @@
+"""
+Tests for the A2A executor's coalescing of intermediate status updates
+"""
+
+import asyncio
+import logging
+
+import pytest
+from a2a.types import Part, TaskState, TextPart
+
+from app.a2a_agent_executor import _StatusCoalescer
+
+
+class FakeTaskUpdater:
+    """Records status updates; a send can be held open with `release`."""
+
+    def __init__(self, fail: bool = False):
+        self.updates = []
+        self.fail = fail
+        self.sending = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    def new_agent_message(self, parts):
+        return parts
+
+    async def update_status(self, state, message=None):
+        self.sending.set()
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("event queue closed")
+        self.updates.append((state, message))
+
+
+def text_part(text: str) -> Part:
+    return Part(root=TextPart(text=text))
+
+
+@pytest.mark.asyncio
+async def test_parts_within_window_are_sent_as_one_update():
+    updater = FakeTaskUpdater()
+    coalescer = _StatusCoalescer(updater, window=0.01)
+
+    coalescer.add([text_part("a")])
+    coalescer.add([text_part("b")])
+    await asyncio.sleep(0.05)
+
+    assert len(updater.updates) == 1
+    state, parts = updater.updates[0]
+    assert state == TaskState.working
+    assert [p.root.text for p in parts] == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_flush_sends_immediately_and_cancels_timer():
+    updater = FakeTaskUpdater()
+    coalescer = _StatusCoalescer(updater, window=10)
+
+    coalescer.add([text_part("a")])
+    await coalescer.flush()
+    await coalescer.flush()
+
+    assert len(updater.updates) == 1
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_timed_send_in_progress():
+    updater = FakeTaskUpdater()
+    updater.release.clear()
+    coalescer = _StatusCoalescer(updater, window=0)
+
+    coalescer.add([text_part("a")])
+    await updater.sending.wait()
+
+    close = asyncio.create_task(coalescer.close())
+    await asyncio.sleep(0.01)
+    assert not close.done()
+
+    updater.release.set()
+    await close
+    # A terminal update sent now is guaranteed to come after the working one
+    await updater.update_status(TaskState.completed)
+    assert [state for state, _ in updater.updates] == [TaskState.working, TaskState.completed]
+
+
+@pytest.mark.asyncio
+async def test_close_drops_parts_not_yet_sent():
+    updater = FakeTaskUpdater()
+    coalescer = _StatusCoalescer(updater, window=10)
+
+    coalescer.add([text_part("a")])
+    await coalescer.close()
+    await asyncio.sleep(0)
+
+    assert updater.updates == []
+
+
+@pytest.mark.asyncio
+async def test_failed_timed_send_is_logged(caplog):
+    updater = FakeTaskUpdater(fail=True)
+    coalescer = _StatusCoalescer(updater, window=0)
+
+    with caplog.at_level(logging.ERROR, logger="app.a2a_agent_executor"):
+        coalescer.add([text_part("a")])
+        await asyncio.sleep(0.01)
+        await coalescer.close()
+
+    assert "event queue closed" in caplog.text
@@ -0,0 +1,92 @@
+"""
+Tests for A2A agent discovery retries
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.a2a_client import RemoteAgentManager
+from app.config import A2A_RETRY_ATTEMPTS
+
+AGENT_CARD = {
+    "name": "Test Agent",
+    "description": "An agent used in tests",
+    "url": "http://agent.test",
+    "version": "1.0.0",
+    "capabilities": {},
+    "defaultInputModes": ["text"],
+    "defaultOutputModes": ["text"],
+    "skills": [],
+}
+
+
+def make_client(responses):
+    """A client whose requests raise or return the given responses in order."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        response = responses[min(len(requests), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), requests
+
+
+@pytest.mark.asyncio
+async def test_discovery_retries_connection_errors():
+    client, requests = make_client([
+        httpx.ConnectError("connection refused"),
+        httpx.ConnectError("connection refused"),
+        httpx.Response(200, json=AGENT_CARD),
+    ])
+
+    async with client:
+        url, card = await RemoteAgentManager()._discover_one(client, "http://agent.test")
+
+    assert url == "http://agent.test"
+    assert card is not None and card.name == "Test Agent"
+    assert len(requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_discovery_gives_up_after_retry_attempts():
+    client, requests = make_client([httpx.Response(503)])
+
+    async with client:
+        _, card = await RemoteAgentManager()._discover_one(client, "http://agent.test")
+
+    assert card is None
+    assert len(requests) == A2A_RETRY_ATTEMPTS
+
+
+@pytest.mark.asyncio
+async def test_discovery_does_not_retry_client_errors():
+    client, requests = make_client([httpx.Response(404)])
+
+    async with client:
+        _, card = await RemoteAgentManager()._discover_one(client, "http://agent.test")
+
+    assert card is None
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_discovery_retries_timeouts(monkeypatch):
+    monkeypatch.setattr("app.a2a_client.A2A_DISCOVERY_TIMEOUT", 0.05)
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json=AGENT_CARD)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        _, card = await RemoteAgentManager()._discover_one(client, "http://agent.test")
+
+    assert card is not None and card.name == "Test Agent"
+    assert len(requests) == 2
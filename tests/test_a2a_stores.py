@@ -0,0 +1,75 @@
+"""
+Tests for the A2A server's size-bounded task and session stores
+"""
+
+import pytest
+from a2a.types import Task, TaskState, TaskStatus
+
+from app.a2a_stores import BoundedSessionService, BoundedTaskStore
+
+
+def make_task(task_id: str, state: TaskState) -> Task:
+    return Task(id=task_id, context_id="ctx", status=TaskStatus(state=state))
+
+
+@pytest.mark.asyncio
+async def test_task_store_evicts_terminal_tasks_before_live_ones():
+    store = BoundedTaskStore(max_tasks=2, ttl_seconds=3600)
+
+    await store.save(make_task("live", TaskState.working))
+    await store.save(make_task("done", TaskState.completed))
+    await store.save(make_task("new", TaskState.working))
+
+    assert await store.get("live") is not None
+    assert await store.get("done") is None
+    assert await store.get("new") is not None
+
+
+@pytest.mark.asyncio
+async def test_task_store_evicts_oldest_live_task_when_none_is_terminal():
+    store = BoundedTaskStore(max_tasks=2, ttl_seconds=3600)
+
+    await store.save(make_task("first", TaskState.working))
+    await store.save(make_task("second", TaskState.input_required))
+    await store.save(make_task("third", TaskState.working))
+
+    assert await store.get("first") is None
+    assert await store.get("second") is not None
+    assert await store.get("third") is not None
+
+
+@pytest.mark.asyncio
+async def test_task_store_sweep_drops_only_expired_terminal_tasks():
+    store = BoundedTaskStore(max_tasks=10, ttl_seconds=0)
+
+    await store.save(make_task("live", TaskState.working))
+    await store.save(make_task("done", TaskState.failed))
+    await store.sweep()
+
+    assert await store.get("live") is not None
+    assert await store.get("done") is None
+
+
+@pytest.mark.asyncio
+async def test_session_service_evicts_least_recently_used_session():
+    service = BoundedSessionService(max_sessions=2, ttl_seconds=3600)
+
+    first = await service.create_session(app_name="app", user_id="u", session_id="first")
+    await service.create_session(app_name="app", user_id="u", session_id="second")
+    # Using the first session makes the second the least recently used
+    await service.get_session(app_name="app", user_id="u", session_id=first.id)
+    await service.create_session(app_name="app", user_id="u", session_id="third")
+
+    assert await service.get_session(app_name="app", user_id="u", session_id="first") is not None
+    assert await service.get_session(app_name="app", user_id="u", session_id="second") is None
+    assert await service.get_session(app_name="app", user_id="u", session_id="third") is not None
+
+
+@pytest.mark.asyncio
+async def test_session_service_sweep_drops_idle_sessions():
+    service = BoundedSessionService(max_sessions=10, ttl_seconds=0)
+
+    await service.create_session(app_name="app", user_id="u", session_id="idle")
+    await service.sweep()
+
+    assert await service.get_session(app_name="app", user_id="u", session_id="idle") is None
@@ -0,0 +1,66 @@
+"""
+Tests for extracting PDF and DOCX documents passed as bytes instead of a path
+"""
+
+import io
+
+import fitz  # type: ignore
+import pytest
+from docx import Document
+
+from app.assistant.utils.data_extractor import extract_docx_data, extract_universal_pdf_data
+
+# Long enough that the extractor reads the text directly instead of running OCR
+PDF_TEXT = "Quarterly report for the ultimate assistant test document"
+
+
+@pytest.fixture
+def pdf_bytes():
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((72, 72), PDF_TEXT)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+@pytest.fixture
+def docx_bytes():
+    doc = Document()
+    doc.add_paragraph("Meeting notes")
+    table = doc.add_table(rows=2, cols=2)
+    for row, values in zip(table.rows, (("Name", "Role"), ("Ada", "Engineer"))):
+        for cell, value in zip(row.cells, values):
+            cell.text = value
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def test_pdf_bytes_are_extracted(pdf_bytes):
+    pages = extract_universal_pdf_data(pdf_bytes)
+
+    assert len(pages) == 1
+    assert pages[0]["page_number"] == 1
+    assert PDF_TEXT in pages[0]["text"]
+
+
+def test_pdf_bytes_match_path(pdf_bytes, tmp_path):
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(pdf_bytes)
+
+    assert extract_universal_pdf_data(pdf_bytes) == extract_universal_pdf_data(str(pdf_path))
+
+
+def test_docx_bytes_are_extracted(docx_bytes):
+    data = extract_docx_data(docx_bytes)
+
+    assert "Meeting notes" in data["text"]
+    assert data["tables"] == [[["Name", "Role"], ["Ada", "Engineer"]]]
+
+
+def test_docx_bytes_match_path(docx_bytes, tmp_path):
+    docx_path = tmp_path / "notes.docx"
+    docx_path.write_bytes(docx_bytes)
+
+    assert extract_docx_data(docx_bytes) == extract_docx_data(str(docx_path))
@@ -0,0 +1,60 @@
+"""
+Tests for the combined register-and-list file tool
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.assistant.tools import file_tools
+
+
+class FakeToolContext:
+    """Session state plus an in-memory artifact store."""
+
+    def __init__(self):
+        self.state = {}
+        self.artifacts = {}
+        self._invocation_context = SimpleNamespace(app_name="app", user_id="user", session=SimpleNamespace(id="session"))
+
+    async def save_artifact(self, filename, artifact):
+        self.artifacts[filename] = artifact
+        return 0
+
+    async def list_artifacts(self):
+        return sorted(self.artifacts)
+
+
+@pytest.fixture
+def uploads_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_tools, "_UPLOADS_DIR", tmp_path)
+    file_tools.mark_uploads_changed()
+    return tmp_path
+
+
+@pytest.mark.asyncio
+async def test_refresh_registers_and_lists_uploads(uploads_dir):
+    (uploads_dir / "notes.txt").write_text("hello")
+    tool_context = FakeToolContext()
+
+    result = await file_tools.refresh_and_list_user_files(tool_context)
+
+    assert [entry["filename"] for entry in result["registered_files"]] == ["notes.txt"]
+    assert "- notes.txt" in result["available_files"]
+    assert not (uploads_dir / "notes.txt").exists()
+
+
+@pytest.mark.asyncio
+async def test_refresh_skips_rescan_until_uploads_change(uploads_dir):
+    tool_context = FakeToolContext()
+    await file_tools.refresh_and_list_user_files(tool_context)
+
+    (uploads_dir / "later.txt").write_text("hello")
+    skipped = await file_tools.refresh_and_list_user_files(tool_context)
+    file_tools.mark_uploads_changed()
+    rescanned = await file_tools.refresh_and_list_user_files(tool_context)
+
+    assert skipped["registered_files"] == []
+    assert [entry["filename"] for entry in rescanned["registered_files"]] == ["later.txt"]
+    assert "- later.txt" in rescanned["available_files"]
+
@@ -0,0 +1,100 @@
+"""
+Tests for the per-user sub-agent tool cache
+"""
+
+import asyncio
+
+import pytest
+from google.adk.agents import Agent
+from google.adk.tools.base_toolset import BaseToolset
+
+from app.assistant import sub_agents
+
+
+class FakeToolset(BaseToolset):
+    """Toolset that records whether it was closed instead of running an MCP server."""
+
+    def __init__(self):
+        super().__init__()
+        self.closed = False
+
+    async def get_tools(self, readonly_context=None):
+        return []
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def fake_factory(name):
+    def create(user_id=None):
+        return Agent(name=f"{name}_{user_id}", model="gemini-2.5-flash-lite", tools=[FakeToolset()])
+    return create
+
+
+@pytest.fixture
+def tool_cache(monkeypatch):
+    """Empty tool cache whose sub-agents use fake toolsets, with the dropped users recorded."""
+    for factory_name in ("create_calendar_agent", "create_task_management_agent", "create_gmail_agent"):
+        monkeypatch.setitem(sub_agents.__dict__, factory_name, fake_factory(factory_name))
+    monkeypatch.setattr(sub_agents, "_tool_cache", type(sub_agents._tool_cache)())
+    dropped = []
+    monkeypatch.setattr(sub_agents, "_tools_dropped_listeners", [dropped.append])
+    return dropped
+
+
+def user_toolsets(user_id):
+    return [
+        toolset
+        for tool in (
+            sub_agents.get_calendar_tool(user_id),
+            sub_agents.get_task_tool(user_id),
+            sub_agents.get_gmail_tool(user_id),
+        )
+        for toolset in sub_agents._toolsets(tool)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_tools_are_reused_per_user(tool_cache):
+    assert sub_agents.get_calendar_tool("alice") is sub_agents.get_calendar_tool("alice")
+    assert sub_agents.get_calendar_tool("alice") is not sub_agents.get_calendar_tool("bob")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_notifies_listeners_and_closes_toolsets(tool_cache):
+    toolsets = user_toolsets("alice")
+
+    sub_agents.invalidate_user_tools("alice")
+    await asyncio.sleep(0)
+
+    assert tool_cache == ["alice"]
+    assert all(toolset.closed for toolset in toolsets)
+    assert sub_agents.get_calendar_tool("alice") is not None
+    assert not sub_agents._toolsets(sub_agents.get_calendar_tool("alice"))[0].closed
+
+
+@pytest.mark.asyncio
+async def test_eviction_drops_all_of_the_least_recent_users_tools(tool_cache, monkeypatch):
+    monkeypatch.setattr(sub_agents, "_TOOL_CACHE_SIZE", 3)
+    alice_toolsets = user_toolsets("alice")
+    bob_toolsets = user_toolsets("bob")
+    await asyncio.sleep(0)
+
+    assert tool_cache == ["alice"]
+    assert all(toolset.closed for toolset in alice_toolsets)
+    assert not any(toolset.closed for toolset in bob_toolsets)
+    assert {user_id for _, user_id in sub_agents._tool_cache} == {"bob"}
+
+
+@pytest.mark.asyncio
+async def test_cached_root_agent_is_dropped_with_its_tools(tool_cache, monkeypatch):
+    from app.assistant import agent
+
+    monkeypatch.setattr(agent, "_agent_cache", type(agent._agent_cache)())
+    sub_agents._tools_dropped_listeners.append(agent._drop_cached_agents)
+    root_agent = agent.create_agent("alice")
+    assert agent.create_agent("alice") is root_agent
+
+    sub_agents.invalidate_user_tools("alice")
+
+    assert agent.create_agent("alice") is not root_agent
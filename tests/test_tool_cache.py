@@ -0,0 +1,95 @@
+"""
+Tests for per-session caching of read-only tool results
+"""
+
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from app.assistant.tools.tool_cache import cached_tool, invalidate_session, session_key
+
+
+_session_ids = itertools.count()
+
+
+class FakeToolContext:
+    """Just the invocation context of a new session that the cache keys on."""
+
+    def __init__(self):
+        self.state = {}
+        self._invocation_context = SimpleNamespace(
+            app_name="app", user_id="user", session=SimpleNamespace(id=f"session-{next(_session_ids)}")
+        )
+
+
+def counting_tool(**cache_options):
+    calls = []
+
+    @cached_tool(ttl=60, **cache_options)
+    async def tool(query: str, tool_context) -> str:
+        calls.append(query)
+        return f"result for {query}"
+
+    return tool, calls
+
+
+def test_session_key_identifies_the_session_without_touching_its_state():
+    tool_context = FakeToolContext()
+
+    key = session_key(tool_context)
+
+    assert session_key(tool_context) == key
+    assert tool_context.state == {}
+    assert session_key(FakeToolContext()) != key
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_per_session_and_arguments():
+    tool, calls = counting_tool()
+    first, second = FakeToolContext(), FakeToolContext()
+
+    assert await tool("a", tool_context=first) == "result for a"
+    assert await tool("a", tool_context=first) == "result for a"
+    await tool("b", tool_context=first)
+    await tool("a", tool_context=second)
+
+    assert calls == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_results_rejected_by_should_cache_are_not_stored():
+    tool, calls = counting_tool(should_cache=lambda result: False)
+    tool_context = FakeToolContext()
+
+    await tool("a", tool_context=tool_context)
+    await tool("a", tool_context=tool_context)
+
+    assert calls == ["a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_session_only_drops_that_session():
+    tool, calls = counting_tool()
+    first, second = FakeToolContext(), FakeToolContext()
+    await tool("a", tool_context=first)
+    await tool("a", tool_context=second)
+
+    invalidate_session(first)
+    await tool("a", tool_context=first)
+    await tool("a", tool_context=second)
+
+    assert calls == ["a", "a", "a"]
+
+
+@pytest.mark.asyncio
+async def test_mutating_a_result_does_not_change_the_cached_copy():
+    @cached_tool(ttl=60)
+    async def tool(tool_context) -> dict:
+        return {"files": ["a.pdf"]}
+
+    tool_context = FakeToolContext()
+    (await tool(tool_context=tool_context))["files"].append("miss.pdf")
+    (await tool(tool_context=tool_context))["files"].append("hit.pdf")
+
+    assert await tool(tool_context=tool_context) == {"files": ["a.pdf"]}